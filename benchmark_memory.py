@@ -0,0 +1,67 @@
+import argparse
+import tracemalloc
+
+from frogger_particles import ParticleSystem
+from frogger_sim import CAR_SIZES, LANE_HEIGHT, ROAD_LANES, SCREEN_WIDTH, Frog, PowerUp, Simulation
+from frogger_traffic import Traffic
+
+def traced(build):
+    # Bytes allocated by build() that are still held by its result
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+def make_traffic(count):
+    traffic = Traffic(SCREEN_WIDTH, capacity=count)
+    for i in range(count):
+        width, height = CAR_SIZES[i % 3]
+        traffic.add_car(i * 7 % SCREEN_WIDTH, LANE_HEIGHT * (i % ROAD_LANES + 2), 3,
+                        width, height, (255, 0, 0), i % 3)
+    traffic.build_index()
+    return traffic
+
+def make_particles(count):
+    particles = ParticleSystem(capacity=count, budget=count)
+    particles.add_explosion(400, 300, (255, 0, 0), count)
+    return particles
+
+def make_powerups(count):
+    return [PowerUp(i * 7 % SCREEN_WIDTH, LANE_HEIGHT * (i % ROAD_LANES + 2), i % 5, 0)
+            for i in range(count)]
+
+def make_level(cars, particles, powerups):
+    sim = Simulation([(255, 0, 0)])
+    sim.traffic = make_traffic(cars)
+    for powerup in make_powerups(powerups):
+        sim.powerups.append(powerup)
+        sim.powerup_index.add(powerup)
+    return sim, make_particles(particles)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report memory per entity and for a whole level")
+    parser.add_argument("--cars", type=int, default=1000)
+    parser.add_argument("--particles", type=int, default=1000)
+    parser.add_argument("--powerups", type=int, default=100)
+    args = parser.parse_args()
+    
+    # Per-entity cost, measured over a batch so fixed overheads average out
+    entities = [
+        ("frog", 1000, lambda n: [Frog(0, 0) for _ in range(n)]),
+        ("power-up", 1000, make_powerups),
+        ("car", args.cars, make_traffic),
+        ("particle", args.particles, make_particles),
+    ]
+    print(f"{'entity':<10}{'bytes each':>12}")
+    for name, count, build in entities:
+        if count == 0:
+            print(f"{name:<10}{'-':>12}")
+            continue
+        build(1)  # Warm up lazily created module state first
+        print(f"{name:<10}{traced(lambda: build(count)) / count:>12.1f}")
+    
+    total = traced(lambda: make_level(args.cars, args.particles, args.powerups))
+    print(f"level with {args.cars} cars, {args.particles} particles and {args.powerups} power-ups: "
+          f"{total / 1024:.1f} KiB")
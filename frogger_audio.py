@@ -0,0 +1,129 @@
+import glob
+import hashlib
+import os
+
+import numpy as np
+
+# Procedural sound effects built from whole sample buffers: every primitive
+# takes the array of sample indices i and returns one value per sample.
+
+def samples(duration, sample_rate):
+    return np.arange(int(duration * sample_rate))
+
+def sine(i, freq, sample_rate):
+    # freq may be a number or an array with one frequency per sample
+    return np.sin(2 * np.pi * freq * i / sample_rate)
+
+def sweep(i, start, end):
+    # Frequency rising (or falling) linearly from start to end
+    return start + (end - start) * i / len(i)
+
+def noise(i, seed=0):
+    # White noise in -0.5..0.5, seeded so the same sound comes out every time
+    return np.random.default_rng(seed).random(len(i)) - 0.5
+
+def fade_out(i):
+    return 1 - i / len(i)
+
+def swell(i):
+    # Rises from silence and falls back over the whole sound
+    return np.sin(np.pi * i / len(i))
+
+def to_samples(wave, channels=2):
+    # 16-bit samples with the wave copied to every channel
+    wave = wave.astype(np.int16)
+    if channels == 1:
+        return wave
+    return np.repeat(wave[:, None], channels, axis=1)
+
+def hop(sample_rate):
+    # Short beep
+    i = samples(0.1, sample_rate)
+    return 4096 * sine(i, 800, sample_rate) * fade_out(i)
+
+def collision(sample_rate):
+    # Crash
+    i = samples(0.3, sample_rate)
+    return 2048 * noise(i) * fade_out(i)
+
+def victory(sample_rate):
+    # Ascending notes
+    i = samples(0.8, sample_rate)
+    return 2048 * sine(i, sweep(i, 400, 800), sample_rate) * swell(i)
+
+def powerup(sample_rate):
+    # Warbling collect sound; the warble runs at 220.5 radians a second
+    i = samples(0.2, sample_rate)
+    warble = 600 + np.sin(220.5 * i / sample_rate) * 200
+    return 3000 * sine(i, warble, sample_rate) * fade_out(i)
+
+def activate(sample_rate):
+    # Rising activation sound
+    i = samples(0.4, sample_rate)
+    return 2500 * sine(i, sweep(i, 300, 600), sample_rate) * swell(i)
+
+def ambient_block(i, sample_rate, traffic=(0.0, 0.0), powerup=(0.0, 0.0)):
+    # One block of the endless ambient track, for the absolute sample indices
+    # i, so consecutive blocks join without clicks. traffic and powerup are
+    # (start, end) levels in 0..1 faded across the block: traffic adds road
+    # hiss and a power-up adds a shimmering high tone over the rumble.
+    wave = 512 * sine(i, 60, sample_rate) + 256 * sine(i, 120, sample_rate)
+    local = i - i[0]
+    if traffic != (0.0, 0.0):
+        wave += 768 * sweep(local, *traffic) * noise(i, seed=int(i[0]))
+    if powerup != (0.0, 0.0):
+        tremolo = 0.5 + 0.5 * sine(i, 4, sample_rate)
+        wave += 384 * sweep(local, *powerup) * tremolo * sine(i, 880, sample_rate)
+    return wave
+
+# Sound name -> function of the sample rate returning the wave
+RECIPES = {
+    'hop': hop,
+    'collision': collision,
+    'victory': victory,
+    'powerup': powerup,
+    'activate': activate,
+}
+
+# Synthesized sounds are cached here as .npy files, one per sound, sample
+# rate and channel count, named {name}-{sample_rate}-{channels}-{key}.npy.
+# Cache keys hash this module's source, so editing a recipe or primitive
+# invalidates every cached sound; a stale file is deleted when the same
+# sound, sample rate and channel count is cached again.
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                         'frogger', 'sounds')
+
+with open(__file__, 'rb') as source:
+    SOURCE_HASH = hashlib.sha1(source.read()).hexdigest()
+
+def cache_key(name, sample_rate, channels):
+    return hashlib.sha1(f"{SOURCE_HASH}:{name}:{sample_rate}:{channels}".encode()).hexdigest()[:16]
+
+def render(name, sample_rate, channels=2, cache_dir=CACHE_DIR):
+    # Samples of the named sound, memory-mapped from the cache when it was
+    # synthesized before; otherwise synthesized and written to the cache
+    prefix = f"{name}-{sample_rate}-{channels}-"
+    path = os.path.join(cache_dir, f"{prefix}{cache_key(name, sample_rate, channels)}.npy")
+    try:
+        return np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+    
+    data = to_samples(RECIPES[name](sample_rate), channels)
+    try:
+        # Written to a temporary file and renamed, so a concurrent launch
+        # never reads a half-written sound
+        os.makedirs(cache_dir, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as cache_file:
+            np.save(cache_file, data)
+        os.replace(temporary, path)
+        
+        # Drop this sound's files from older versions of the recipes, keeping
+        # those for other sample rates and channel counts
+        for stale in glob.glob(os.path.join(glob.escape(cache_dir), f"{prefix}*.npy")):
+            if stale != path:
+                os.remove(stale)
+    except OSError:
+        pass  # A read-only cache only costs the synthesis
+    return data
@@ -0,0 +1,1059 @@
+import argparse
+import math
+import random
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+import frogger_audio
+import frogger_sim
+from frogger_mixer import AmbientStream, VoiceManager, init_mixer
+from frogger_particles import ParticleSystem
+from frogger_sim import LANE_HEIGHT, ROAD_LANES, SCREEN_HEIGHT, SCREEN_WIDTH
+from frogger_warmup import Warmup
+
+# Constants (the playfield sizes come from frogger_sim)
+FPS = 60
+
+# Colors
+BLACK = (0, 0, 0)
+GREEN = (34, 139, 34)
+DARK_GREEN = (0, 100, 0)
+WHITE = (255, 255, 255)
+RED = (220, 20, 60)
+BLUE = (30, 144, 255)
+YELLOW = (255, 215, 0)
+GRAY = (105, 105, 105)
+DARK_GRAY = (64, 64, 64)
+ORANGE = (255, 165, 0)
+PURPLE = (138, 43, 226)
+BROWN = (139, 69, 19)
+CYAN = (0, 255, 255)
+PINK = (255, 192, 203)
+GOLD = (255, 215, 0)
+
+# Colors of the plain graphics of the original version
+PLAIN_GREEN = (0, 255, 0)
+PLAIN_RED = (255, 0, 0)
+PLAIN_BLUE = (0, 0, 255)
+PLAIN_YELLOW = (255, 255, 0)
+PLAIN_GRAY = (128, 128, 128)
+
+# Frog hop direction for each arrow key: 0=up, 1=right, 2=down, 3=left
+KEY_DIRECTIONS = {pygame.K_UP: 0, pygame.K_RIGHT: 1, pygame.K_DOWN: 2, pygame.K_LEFT: 3}
+
+class Variant:
+    # One version of the game as a set of features over the shared engine.
+    # detailed selects the sprite graphics, scenery and car types over the
+    # plain shapes of the original version, which also hid the frog once it
+    # had crossed (frog_after_win=False)
+    def __init__(self, caption, detailed=True, sound=True, particles=True,
+                 screen_shake=True, powerups=False, frog_after_win=True):
+        self.caption = caption
+        self.detailed = detailed
+        self.sound = sound
+        self.particles = particles
+        self.screen_shake = screen_shake
+        self.powerups = powerups
+        self.frog_after_win = frog_after_win
+    
+    def with_features(self, **features):
+        # A copy of this variant with some features switched
+        return Variant(**{**vars(self), **features})
+
+BASIC = Variant("Frogger - Cross the Street!", detailed=False, sound=False,
+                particles=False, screen_shake=False, frog_after_win=False)
+ENHANCED = Variant("Enhanced Frogger - Cross the Street!")
+POWERUPS = Variant("Frogger with Power-ups!", powerups=True)
+VARIANTS = {'basic': BASIC, 'enhanced': ENHANCED, 'powerups': POWERUPS}
+
+class PowerUp(frogger_sim.PowerUp):
+    # Power-ups are simulated by frogger_sim; this class adds their look.
+    __slots__ = ()
+    # Color and name of each power_type
+    colors = {
+        0: CYAN,      # Speed boost
+        1: GOLD,      # Invincibility
+        2: PINK,      # Extra life
+        3: PURPLE,    # Slow cars
+        4: ORANGE     # Jump boost
+    }
+    names = {
+        0: "SPEED",
+        1: "SHIELD",
+        2: "LIFE",
+        3: "SLOW",
+        4: "JUMP"
+    }
+    # Length of the pulse animation loop in frames
+    pulse_frames = 32
+    # Pre-rendered pulse animation frames keyed by power_type
+    animation_cache = {}
+    
+    def get_frames(self):
+        frames = PowerUp.animation_cache.get(self.power_type)
+        if frames is None:
+            frames = self.render_frames()
+            PowerUp.animation_cache[self.power_type] = frames
+        return frames
+    
+    def render_frames(self):
+        # Frames that pulse to the same size share one sprite
+        sprites = {}
+        frames = []
+        for frame in range(PowerUp.pulse_frames):
+            pulse = math.sin(2 * math.pi * frame / PowerUp.pulse_frames) * 0.3 + 0.7
+            current_size = int(self.size * pulse)
+            if current_size not in sprites:
+                sprites[current_size] = self.render_sprite(current_size)
+            frames.append(sprites[current_size])
+        return frames
+    
+    def render_sprite(self, current_size):
+        # Room for the outer glow at full size
+        sprite = pygame.Surface(((self.size + 7) * 2, (self.size + 7) * 2), pygame.SRCALPHA)
+        center_x, center_y = sprite.get_rect().center
+        
+        color = self.colors[self.power_type]
+        
+        # Draw outer glow
+        for i in range(3):
+            pygame.draw.circle(sprite, color, (center_x, center_y), current_size + i * 3)
+        
+        # Draw main power-up
+        pygame.draw.circle(sprite, color, (center_x, center_y), current_size)
+        pygame.draw.circle(sprite, WHITE, (center_x, center_y), current_size, 2)
+        
+        # Draw icon based on type
+        if self.power_type == 0:  # Speed
+            # Lightning bolt
+            points = [
+                (center_x - 5, center_y - 8),
+                (center_x + 2, center_y - 2),
+                (center_x - 2, center_y + 2),
+                (center_x + 5, center_y + 8)
+            ]
+            pygame.draw.lines(sprite, WHITE, False, points, 3)
+        elif self.power_type == 1:  # Invincibility
+            # Shield
+            pygame.draw.polygon(sprite, WHITE, [
+                (center_x, center_y - 8),
+                (center_x - 6, center_y - 4),
+                (center_x - 6, center_y + 4),
+                (center_x, center_y + 8),
+                (center_x + 6, center_y + 4),
+                (center_x + 6, center_y - 4)
+            ])
+        elif self.power_type == 2:  # Extra life
+            # Heart
+            pygame.draw.circle(sprite, WHITE, (center_x - 3, center_y - 2), 3)
+            pygame.draw.circle(sprite, WHITE, (center_x + 3, center_y - 2), 3)
+            pygame.draw.polygon(sprite, WHITE, [
+                (center_x - 6, center_y),
+                (center_x, center_y + 6),
+                (center_x + 6, center_y)
+            ])
+        elif self.power_type == 3:  # Slow cars
+            # Clock
+            pygame.draw.circle(sprite, WHITE, (center_x, center_y), 6, 2)
+            pygame.draw.line(sprite, WHITE, (center_x, center_y), (center_x, center_y - 4), 2)
+            pygame.draw.line(sprite, WHITE, (center_x, center_y), (center_x + 3, center_y), 2)
+        elif self.power_type == 4:  # Jump boost
+            # Arrow up
+            pygame.draw.polygon(sprite, WHITE, [
+                (center_x, center_y - 6),
+                (center_x - 4, center_y - 2),
+                (center_x - 2, center_y - 2),
+                (center_x - 2, center_y + 6),
+                (center_x + 2, center_y + 6),
+                (center_x + 2, center_y - 2),
+                (center_x + 4, center_y - 2)
+            ])
+        
+        return sprite
+    
+    def draw(self, screen, ticks):
+        if self.collected:
+            return pygame.Rect(self.x, self.y, 0, 0)
+        
+        # Pulsing animation, ticks being the simulation's tick count
+        sprite = self.get_frames()[(ticks - self.spawn_tick) % PowerUp.pulse_frames]
+        return screen.blit(sprite, sprite.get_rect(center=(int(self.x), int(self.y))))
+
+class SoundManager:
+    # Sound effects synthesized by frogger_audio
+    names = ('hop', 'collision', 'victory')
+    powerup_names = ('powerup', 'activate')
+    # Mixer channels reserved for each group of sounds
+    channel_groups = {'effects': 4, 'powerups': 2, 'ambient': 1}
+    # Sound name -> (channel group, max simultaneous voices, priority)
+    sound_voices = {
+        'hop': ('effects', 2, 1),
+        'collision': ('effects', 1, 3),
+        'victory': ('effects', 1, 4),
+        'powerup': ('powerups', 1, 2),
+        'activate': ('powerups', 1, 2),
+    }
+    
+    def __init__(self, powerups=False):
+        # Sounds are loaded by load_sounds, or one by one by load_sound from
+        # the warmup thread; play() skips sounds that are not loaded yet
+        self.sounds = {}
+        self.failed = False
+        self.voice_manager = None  # Created with the first sound
+        self.ambient = None  # AmbientStream, once started
+        # Once stopped, the warmup thread may no longer start the ambient track
+        self.stopped = False
+        self.lock = threading.Lock()
+        
+        # Power-up sounds and their channels only when the game has power-ups
+        self.names = SoundManager.names + (SoundManager.powerup_names if powerups else ())
+        self.channel_groups = {group: count for group, count in SoundManager.channel_groups.items()
+                               if powerups or group != 'powerups'}
+    
+    def load_sounds(self):
+        for name in self.names:
+            self.load_sound(name)
+    
+    def load_sound(self, name):
+        # The sound at the mixer's own sample rate and channel count,
+        # synthesized on the first launch and read from the cache after that
+        if self.failed:
+            return
+        try:
+            sample_rate, _, channels = pygame.mixer.get_init()
+            if self.voice_manager is None:
+                self.voice_manager = VoiceManager(self.channel_groups, self.sound_voices)
+            samples = frogger_audio.render(name, sample_rate, channels)
+            self.sounds[name] = pygame.sndarray.make_sound(samples)
+        except:
+            self.failed = True
+            print("Sound initialization failed - continuing without sound")
+    
+    def play(self, sound_name):
+        if sound_name in self.sounds:
+            self.voice_manager.play(sound_name, self.sounds[sound_name])
+    
+    def new_frame(self):
+        # Start a new frame's budget of sounds
+        if self.voice_manager is not None:
+            self.voice_manager.new_frame()
+    
+    def start_ambient(self):
+        # Stream the ambient track on its reserved channel
+        with self.lock:
+            if self.voice_manager is not None and self.ambient is None and not self.stopped:
+                self.ambient = AmbientStream(self.voice_manager.groups['ambient'][0])
+                self.ambient.start()
+    
+    def set_mood(self, traffic, powerup=0.0):
+        if self.ambient is not None:
+            self.ambient.set_mood(traffic, powerup)
+    
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            if self.ambient is not None:
+                self.ambient.stop()
+
+class PlainFrog(frogger_sim.Frog):
+    # The frog as drawn by the original version: a circle with eyes
+    __slots__ = ()
+    
+    def draw(self, screen):
+        body_rect = pygame.draw.circle(screen, PLAIN_GREEN, (int(self.x), int(self.y)), self.size // 2)
+        # Draw simple frog eyes
+        pygame.draw.circle(screen, BLACK, (int(self.x - 8), int(self.y - 8)), 3)
+        pygame.draw.circle(screen, BLACK, (int(self.x + 8), int(self.y - 8)), 3)
+        return body_rect
+
+class Frog(frogger_sim.Frog):
+    # The frog is simulated by frogger_sim; this class adds its animation and look.
+    __slots__ = ('animation_time', 'mouth_open', 'next_mouth_time')
+    # Vertical hop offset for each remaining hop frame (0 = landed)
+    hop_offsets = [0] + [-int(5 * math.sin(math.pi * (10 - frame) / 10)) for frame in range(1, 11)]
+    # Body color of each palette
+    palettes = {
+        'normal': GREEN,
+        'hop': (min(255, GREEN[0] + 30), min(255, GREEN[1] + 30), GREEN[2]),
+        'invincible': GOLD,
+        'speed': CYAN,
+        'jump': ORANGE,
+    }
+    # Pre-rendered frog sprites keyed by (direction, palette, mouth_open)
+    sprite_cache = {}
+    
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.animation_time = 0
+        self.mouth_open = False
+        self.next_mouth_time = random.randint(1, 241)
+    
+    def update(self):
+        super().update()
+        self.animation_time += 1
+        
+        # Occasional blink/mouth movement, scheduled rather than rolled every frame
+        self.mouth_open = self.animation_time == self.next_mouth_time
+        if self.mouth_open:
+            self.next_mouth_time = self.animation_time + random.randint(1, 241)
+    
+    def get_palette(self):
+        # Color changes based on power-ups
+        if self.invincible:
+            # Flashing golden color
+            return 'invincible' if int(self.animation_time / 5) % 2 else 'normal'
+        elif self.speed_boost:
+            return 'speed'
+        elif self.jump_boost:
+            return 'jump'
+        elif self.hop_animation > 0:
+            return 'hop'
+        return 'normal'
+    
+    def get_sprite(self):
+        key = (self.direction, self.get_palette(), self.mouth_open)
+        sprite = Frog.sprite_cache.get(key)
+        if sprite is None:
+            sprite = self.render_sprite(*key)
+            Frog.sprite_cache[key] = sprite
+        return sprite
+    
+    def render_sprite(self, direction, palette, mouth_open):
+        # Room for the legs on either side and the eyes above the body
+        sprite = pygame.Surface((self.size + 12, self.size + 4), pygame.SRCALPHA)
+        center_x, center_y = sprite.get_rect().center
+        
+        # Main body
+        pygame.draw.ellipse(sprite, Frog.palettes[palette],
+                          (center_x - self.size//2, center_y - self.size//3,
+                           self.size, self.size//1.5))
+        
+        # Eyes
+        eye_offset = 8
+        if direction == 1:  # Right
+            eye1_pos = (center_x + 5, center_y - 8)
+            eye2_pos = (center_x + 5, center_y + 2)
+        elif direction == 3:  # Left
+            eye1_pos = (center_x - 5, center_y - 8)
+            eye2_pos = (center_x - 5, center_y + 2)
+        else:  # Up/Down
+            eye1_pos = (center_x - eye_offset, center_y - 8)
+            eye2_pos = (center_x + eye_offset, center_y - 8)
+        
+        # Eye whites
+        pygame.draw.circle(sprite, WHITE, eye1_pos, 5)
+        pygame.draw.circle(sprite, WHITE, eye2_pos, 5)
+        
+        # Eye pupils
+        pygame.draw.circle(sprite, BLACK, eye1_pos, 3)
+        pygame.draw.circle(sprite, BLACK, eye2_pos, 3)
+        
+        # Legs (simple)
+        leg_color = DARK_GREEN
+        if direction == 0 or direction == 2:  # Up/Down
+            # Side legs
+            pygame.draw.ellipse(sprite, leg_color,
+                              (center_x - self.size//2 - 5, center_y - 5, 8, 10))
+            pygame.draw.ellipse(sprite, leg_color,
+                              (center_x + self.size//2 - 3, center_y - 5, 8, 10))
+        
+        # Mouth
+        if mouth_open:
+            pygame.draw.arc(sprite, BLACK,
+                          (center_x - 6, center_y + 2, 12, 8), 0, math.pi, 2)
+        
+        return sprite
+    
+    def draw(self, screen):
+        frog_x = int(self.x)
+        frog_y = int(self.y + Frog.hop_offsets[self.hop_animation])
+        
+        # Draw invincibility shield
+        shield_rect = None
+        if self.invincible:
+            shield_radius = self.size + 5 + int(3 * math.sin(self.animation_time * 0.3))
+            shield_rect = pygame.draw.circle(screen, GOLD, (frog_x, frog_y), shield_radius, 3)
+        
+        sprite = self.get_sprite()
+        frog_rect = screen.blit(sprite, sprite.get_rect(center=(frog_x, frog_y)))
+        if shield_rect:
+            frog_rect.union_ip(shield_rect)
+        return frog_rect
+
+class PlainCar:
+    # Cars as drawn by the original version: a box with two windows
+    @staticmethod
+    def draw(screen, x, top, width, height, color):
+        car_rect = pygame.draw.rect(screen, color, (x, top, width, height))
+        # Draw simple car details
+        pygame.draw.rect(screen, WHITE, (x + 5, top + 5, 15, 8))
+        pygame.draw.rect(screen, WHITE, (x + width - 20, top + 5, 15, 8))
+        return car_rect
+
+class Car:
+    # Cars are simulated by Traffic; this class only renders them.
+    # Width and height for each car_type: 0=car, 1=truck, 2=sports car
+    sizes = frogger_sim.CAR_SIZES
+    # Pre-rendered car sprites keyed by (car_type, color, heading, slowed)
+    sprite_cache = {}
+    
+    @staticmethod
+    def get_sprite(car_type, color, heading, slowed=False):
+        key = (car_type, color, heading, slowed)
+        sprite = Car.sprite_cache.get(key)
+        if sprite is None:
+            sprite = Car.render_sprite(*key)
+            Car.sprite_cache[key] = sprite
+        return sprite
+    
+    @staticmethod
+    def render_sprite(car_type, color, heading, slowed):
+        width, height = Car.sizes[car_type]
+        center_y = height // 2
+        # Leave room below the body for the wheels
+        sprite = pygame.Surface((width, height + 2), pygame.SRCALPHA)
+        body_rect = pygame.Rect(0, 0, width, height)
+        
+        # Draw car body (tinted if slowed)
+        car_color = color
+        if slowed:
+            # Add blue tint for slow effect
+            car_color = tuple(min(255, c + 50) if i == 2 else max(0, c - 30) for i, c in enumerate(color))
+        
+        pygame.draw.rect(sprite, car_color, body_rect)
+        pygame.draw.rect(sprite, BLACK, body_rect, 2)
+        
+        # Draw car details based on type
+        if car_type == 0:  # Regular car
+            # Windows
+            pygame.draw.rect(sprite, WHITE, (5, 3, 15, 8))
+            pygame.draw.rect(sprite, WHITE, (width - 20, 3, 15, 8))
+            # Headlights
+            if heading < 0:  # Moving left, headlights on left
+                pygame.draw.circle(sprite, YELLOW, (5, center_y), 3)
+            else:  # Moving right, headlights on right
+                pygame.draw.circle(sprite, YELLOW, (width - 5, center_y), 3)
+        
+        elif car_type == 1:  # Truck
+            # Cab windows
+            pygame.draw.rect(sprite, WHITE, (5, 2, 12, 10))
+            # Cargo area
+            pygame.draw.rect(sprite, DARK_GRAY, (25, 0, width - 30, height))
+        
+        elif car_type == 2:  # Sports car
+            # Sleek windows
+            pygame.draw.polygon(sprite, WHITE, [
+                (8, 2),
+                (20, 2),
+                (18, center_y + height // 2 - 2),
+                (10, center_y + height // 2 - 2)
+            ])
+            # Racing stripes
+            pygame.draw.rect(sprite, WHITE, (width // 2 - 1, 0, 2, height))
+        
+        # Draw wheels
+        wheel_y = center_y + height // 2 - 3
+        wheel1_x = 8
+        wheel2_x = width - 8
+        
+        pygame.draw.circle(sprite, BLACK, (wheel1_x, wheel_y), 4)
+        pygame.draw.circle(sprite, BLACK, (wheel2_x, wheel_y), 4)
+        pygame.draw.circle(sprite, DARK_GRAY, (wheel1_x, wheel_y), 2)
+        pygame.draw.circle(sprite, DARK_GRAY, (wheel2_x, wheel_y), 2)
+        
+        return sprite
+
+class TextCache:
+    def __init__(self, max_size=64):
+        # Rendered text surfaces keyed by (font, text, color), least recently used first
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+    
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.surfaces[key] = surface
+            # Evict the least recently used surface once the cache is full
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+def init_pygame(sound=True):
+    # Start only the SDL subsystems the game uses. This runs when a Game is
+    # created rather than at import, so tools can import this module cheaply
+    # and without an audio device
+    pygame.display.init()
+    pygame.font.init()
+    if sound:
+        init_mixer()
+
+class Game:
+    # Every version of the game: one main loop over frogger_sim, with the
+    # variant's features switching graphics, sound, particles and power-ups
+    variant = ENHANCED
+    # Power-up announcements keyed by power_type
+    powerup_messages = {
+        0: ("SPEED BOOST!", CYAN),
+        1: ("INVINCIBLE!", GOLD),
+        2: ("EXTRA LIFE!", PINK),
+        3: ("CARS SLOWED!", PURPLE),
+        4: ("JUMP BOOST!", ORANGE)
+    }
+    
+    def __init__(self, dirty_rects=False, time_scale=1.0, interpolate=True,
+                 continuous_collision=False, fast=False, sound=True, variant=None):
+        if variant is not None:
+            self.variant = variant
+        variant = self.variant
+        self.sound = sound and variant.sound
+        
+        init_pygame(self.sound)
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(variant.caption)
+        self.clock = pygame.time.Clock()
+        
+        # Dirty-rect rendering: only push regions that changed to the display
+        self.dirty_rects = dirty_rects
+        self.previous_rects = []
+        self.full_redraw = True
+        
+        # Fixed-timestep simulation on a game clock: time_scale > 1 runs several
+        # ticks per frame, fast runs uncapped at one tick per frame
+        self.game_clock = frogger_sim.GameClock(time_scale, fast)
+        self.interpolate = interpolate
+        
+        # Initialize systems
+        self.sound_manager = SoundManager(variant.powerups)
+        self.particle_system = ParticleSystem() if variant.particles else None
+        
+        # Presentation state
+        self.screen_shake = 0
+        # Off-screen world layer reused for every shaking frame
+        self.world_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.active_powerup_effects = []
+        
+        # Game rules and state: frog, cars, power-ups, lives and score.
+        # Continuous collision sweeps the frog's hop and the cars' moves over
+        # each tick so fast movers cannot tunnel through one another
+        if variant.detailed:
+            colors, frog_class = [RED, BLUE, YELLOW, WHITE, ORANGE, PURPLE], Frog
+        else:
+            colors, frog_class = [PLAIN_RED, PLAIN_BLUE, PLAIN_YELLOW, WHITE], PlainFrog
+        self.sim = frogger_sim.Simulation(colors, car_types=variant.detailed, powerups=variant.powerups,
+                                          continuous_collision=continuous_collision,
+                                          clock=self.game_clock, frog_class=frog_class, powerup_class=PowerUp)
+        
+        # Sounds and sprites are prepared in the background while the first
+        # frames are drawn; draw_ui shows a loading indicator until then
+        self.warmup = Warmup(self.warmup_tasks())
+        
+        # Font for text
+        self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 24)
+        self.tiny_font = pygame.font.Font(None, 18)
+        self.text_cache = TextCache()
+        self.overlay = None
+        
+        # Background elements
+        self.trees = self.create_trees() if variant.detailed else []
+        self.background = None
+        self.refresh_background()
+    
+    def warmup_tasks(self):
+        # Every car sprite the current traffic uses and, with a mixer, each
+        # sound and the ambient track. The sprite keys are collected here, on
+        # the main thread, so the warmup never reads traffic while the
+        # simulation changes it
+        tasks = []
+        if self.variant.detailed:
+            traffic = self.sim.traffic
+            tints = (False, True) if self.variant.powerups else (False,)
+            car_keys = {(traffic.car_types[i], traffic.colors[i], -1 if traffic.speed[i] < 0 else 1, slowed)
+                        for i in range(traffic.count) for slowed in tints}
+            tasks.append(("car sprites", lambda: [Car.get_sprite(*key) for key in car_keys]))
+        if self.sound and pygame.mixer.get_init():
+            tasks[:0] = [(f"{name} sound", lambda name=name: self.sound_manager.load_sound(name))
+                         for name in self.sound_manager.names]
+            tasks.append(("ambient track", self.sound_manager.start_ambient))
+        return tasks
+    
+    def create_trees(self):
+        trees = []
+        # Add trees in safe zones
+        for i in range(10):
+            x = random.randint(50, SCREEN_WIDTH - 50)
+            y = random.randint(10, LANE_HEIGHT - 20)
+            trees.append((x, y))
+        for i in range(8):
+            x = random.randint(50, SCREEN_WIDTH - 50)
+            y = random.randint(SCREEN_HEIGHT - LANE_HEIGHT + 10, SCREEN_HEIGHT - 20)
+            trees.append((x, y))
+        return trees
+    
+    def handle_sim_events(self):
+        # Sounds, particles and messages for what happened in the simulation
+        particles = self.particle_system
+        for event in self.sim.drain_events():
+            if event[0] == 'hop':
+                self.sound_manager.play('hop')
+                if particles is not None:
+                    particles.add_dust(event[1], event[2] + 15)
+            elif event[0] == 'collision':
+                self.sound_manager.play('collision')
+                if particles is not None:
+                    particles.add_explosion(event[1], event[2], RED, 15)
+                if self.variant.screen_shake:
+                    self.screen_shake = 10
+            elif event[0] == 'win':
+                self.sound_manager.play('victory')
+                if particles is not None:
+                    particles.add_explosion(event[1], event[2], GREEN, 20)
+            elif event[0] == 'powerup':
+                self.show_powerup(event[1])
+    
+    def show_powerup(self, powerup):
+        self.sound_manager.play('powerup')
+        
+        # Create particle effect
+        if self.particle_system is not None:
+            self.particle_system.add_powerup_effect(powerup.x, powerup.y, powerup.colors[powerup.power_type])
+        
+        self.add_powerup_message(*Game.powerup_messages[powerup.power_type])
+        self.sound_manager.play('activate')
+    
+    def add_powerup_message(self, message, color):
+        self.active_powerup_effects.append({
+            'message': message,
+            'color': color,
+            'time': self.sim.now(),
+            'duration': 3.0
+        })
+    
+    def refresh_background(self):
+        # Pre-render the static scenery once; call again whenever lanes,
+        # trees or colors change so each frame is a single blit
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
+        if self.variant.detailed:
+            self.draw_background(self.background)
+        self.draw_road(self.background)
+    
+    def draw_background(self, surface):
+        # Draw gradient sky
+        for y in range(LANE_HEIGHT):
+            color_ratio = y / LANE_HEIGHT
+            sky_color = (
+                int(135 + (200 - 135) * color_ratio),
+                int(206 + (230 - 206) * color_ratio),
+                int(235 + (255 - 235) * color_ratio)
+            )
+            pygame.draw.line(surface, sky_color, (0, y), (SCREEN_WIDTH, y))
+        
+        # Draw trees
+        for tree_x, tree_y in self.trees:
+            # Tree trunk
+            pygame.draw.rect(surface, BROWN, (tree_x - 3, tree_y, 6, 15))
+            # Tree leaves
+            pygame.draw.circle(surface, DARK_GREEN, (tree_x, tree_y - 5), 8)
+            pygame.draw.circle(surface, GREEN, (tree_x, tree_y - 5), 6)
+    
+    def draw_road(self, surface):
+        detailed = self.variant.detailed
+        
+        # Draw grass areas
+        grass_color = GREEN if detailed else PLAIN_GREEN
+        pygame.draw.rect(surface, grass_color, (0, 0, SCREEN_WIDTH, LANE_HEIGHT))
+        pygame.draw.rect(surface, grass_color,
+                        (0, SCREEN_HEIGHT - LANE_HEIGHT, SCREEN_WIDTH, LANE_HEIGHT))
+        
+        # Draw road with texture
+        for lane in range(ROAD_LANES):
+            lane_y = LANE_HEIGHT + lane * LANE_HEIGHT
+            
+            # Alternate road colors slightly
+            if detailed:
+                road_color = GRAY if lane % 2 == 0 else DARK_GRAY
+            else:
+                road_color = PLAIN_GRAY
+            pygame.draw.rect(surface, road_color,
+                           (0, lane_y, SCREEN_WIDTH, LANE_HEIGHT))
+            
+            # Draw lane dividers
+            if lane < ROAD_LANES - 1:
+                for x in range(0, SCREEN_WIDTH, 40):
+                    pygame.draw.rect(surface, WHITE,
+                                   (x, lane_y + LANE_HEIGHT - 2, 20, 4))
+        
+        # Draw road edges
+        if detailed:
+            pygame.draw.rect(surface, WHITE,
+                            (0, LANE_HEIGHT - 2, SCREEN_WIDTH, 4))
+            pygame.draw.rect(surface, WHITE,
+                            (0, LANE_HEIGHT + ROAD_LANES * LANE_HEIGHT - 2, SCREEN_WIDTH, 4))
+    
+    def draw_cars(self, surface, alpha=1.0):
+        traffic = self.sim.traffic
+        n = traffic.count
+        
+        # Interpolate between the last two simulation ticks
+        draw_x = traffic.previous_x[:n] + (traffic.x[:n] - traffic.previous_x[:n]) * alpha
+        
+        if not self.variant.detailed:
+            left = draw_x.tolist()
+            top = traffic.tops().tolist()
+            width = traffic.width[:n].tolist()
+            height = traffic.height[:n].tolist()
+            return [PlainCar.draw(surface, left[i], top[i], width[i], height[i], traffic.colors[i])
+                    for i in range(n)]
+        
+        left = draw_x.astype(int).tolist()
+        top = traffic.tops().astype(int).tolist()
+        heading = np.where(traffic.speed[:n] < 0, -1, 1).tolist()
+        slowed_cars = traffic.slowed() if self.variant.powerups else np.zeros(n, dtype=bool)
+        slowed = slowed_cars.tolist()
+        
+        # Blit every car sprite in one call
+        rects = surface.blits([
+            (Car.get_sprite(traffic.car_types[i], traffic.colors[i], heading[i], slowed[i]),
+             (left[i], top[i]))
+            for i in range(n)
+        ])
+        
+        # Draw slow effect indicator
+        for i in np.flatnonzero(slowed_cars):
+            # Draw blue particles around car
+            for _ in range(3):
+                offset_x = random.randint(-5, 5)
+                offset_y = random.randint(-5, 5)
+                pygame.draw.circle(surface, BLUE,
+                                 (int(draw_x[i] + traffic.width[i] // 2 + offset_x),
+                                  int(traffic.y[i] + offset_y)), 2)
+        
+        return rects
+    
+    def draw_text(self, font, message, position, color=WHITE):
+        # Detailed graphics give text a drop shadow one pixel down and right
+        rects = []
+        if self.variant.detailed:
+            shadow = self.text_cache.render(font, message, BLACK)
+            rects.append(self.screen.blit(shadow, (position[0] + 1, position[1] + 1)))
+        rects.append(self.screen.blit(self.text_cache.render(font, message, color), position))
+        return rects
+    
+    def draw_ui(self):
+        ui_rects = []
+        
+        # Draw lives, as heart icons with detailed graphics
+        if self.variant.detailed:
+            for i in range(self.sim.lives):
+                heart_x = 20 + i * 30
+                heart_y = 20
+                # Simple heart shape
+                ui_rects.append(pygame.draw.circle(self.screen, RED, (heart_x - 5, heart_y), 8))
+                ui_rects.append(pygame.draw.circle(self.screen, RED, (heart_x + 5, heart_y), 8))
+                ui_rects.append(pygame.draw.polygon(self.screen, RED, [
+                    (heart_x - 12, heart_y + 3),
+                    (heart_x, heart_y + 15),
+                    (heart_x + 12, heart_y + 3)
+                ]))
+        else:
+            lives_text = self.text_cache.render(self.font, f"Lives: {self.sim.lives}", WHITE)
+            ui_rects.append(self.screen.blit(lives_text, (10, 10)))
+        
+        if self.variant.powerups:
+            # Draw score
+            ui_rects.extend(self.draw_text(self.font, f"Score: {self.sim.get_score()}", (SCREEN_WIDTH - 150, 10)))
+            
+            # Draw time
+            ui_rects.extend(self.draw_text(self.small_font, f"Time: {int(self.sim.elapsed())}s",
+                                           (SCREEN_WIDTH - 150, 40)))
+            
+            ui_rects.extend(self.draw_powerup_status())
+        else:
+            # Draw score (time)
+            ui_rects.extend(self.draw_text(self.font, f"Time: {self.sim.get_score()}s", (SCREEN_WIDTH - 150, 10)))
+        
+        # Draw instructions
+        if not self.sim.game_over and not self.sim.won:
+            if self.variant.powerups:
+                instructions = "Arrow keys to move • Collect power-ups!"
+            else:
+                instructions = "Use ARROW KEYS to move. Reach the top!"
+            ui_rects.extend(self.draw_text(self.small_font, instructions, (10, SCREEN_HEIGHT - 30)))
+        
+        # Draw pause notice
+        if self.game_clock.paused:
+            pause_text = self.text_cache.render(self.font, "PAUSED - press P to resume", WHITE)
+            pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            ui_rects.append(self.screen.blit(pause_text, pause_rect))
+        
+        # Draw loading indicator while assets warm up
+        if not self.warmup.finished():
+            loading_text = self.text_cache.render(self.small_font, self.warmup.status(), WHITE)
+            loading_rect = loading_text.get_rect(bottomright=(SCREEN_WIDTH - 10, SCREEN_HEIGHT - 10))
+            ui_rects.append(self.screen.blit(loading_text, loading_rect))
+        
+        return ui_rects
+    
+    def draw_powerup_status(self):
+        ui_rects = []
+        
+        # Draw active power-up status
+        y_offset = 70
+        if self.sim.frog.speed_boost:
+            remaining = max(0, int(self.sim.frog.speed_boost_end - self.sim.now()))
+            boost_text = self.text_cache.render(self.tiny_font, f"SPEED: {remaining}s", CYAN)
+            ui_rects.append(self.screen.blit(boost_text, (10, y_offset)))
+            y_offset += 20
+        
+        if self.sim.frog.invincible:
+            remaining = max(0, int(self.sim.frog.invincible_end - self.sim.now()))
+            shield_text = self.text_cache.render(self.tiny_font, f"SHIELD: {remaining}s", GOLD)
+            ui_rects.append(self.screen.blit(shield_text, (10, y_offset)))
+            y_offset += 20
+        
+        if self.sim.frog.jump_boost:
+            remaining = max(0, int(self.sim.frog.jump_boost_end - self.sim.now()))
+            jump_text = self.text_cache.render(self.tiny_font, f"JUMP: {remaining}s ({self.sim.frog.jump_boost_uses} uses)", ORANGE)
+            ui_rects.append(self.screen.blit(jump_text, (10, y_offset)))
+            y_offset += 20
+        
+        # Draw power-up messages
+        current_time = self.sim.now()
+        for effect in self.active_powerup_effects[:]:
+            if current_time - effect['time'] > effect['duration']:
+                self.active_powerup_effects.remove(effect)
+            else:
+                alpha = 1.0 - (current_time - effect['time']) / effect['duration']
+                message_y = SCREEN_HEIGHT // 2 - 50
+                message_text = self.text_cache.render(self.font, effect['message'], effect['color'])
+                message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, message_y))
+                ui_rects.append(self.screen.blit(message_text, message_rect))
+        
+        return ui_rects
+    
+    def draw_game_over(self):
+        if self.overlay is None:
+            self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.overlay.set_alpha(128)
+            self.overlay.fill(BLACK)
+        self.screen.blit(self.overlay, (0, 0))
+        
+        detailed = self.variant.detailed
+        if self.sim.won:
+            title, title_color = "CONGRATULATIONS!", GREEN if detailed else PLAIN_GREEN
+            subtitle = f"You crossed in {self.sim.get_score()} seconds!"
+        else:
+            title, title_color = "GAME OVER", RED if detailed else PLAIN_RED
+            subtitle = "You ran out of lives!"
+        if self.variant.powerups:
+            subtitle = f"Final Score: {self.sim.get_score()}"
+        
+        restart_message = "Press SPACE to play again or ESC to quit"
+        title_text = self.text_cache.render(self.font, title, title_color)
+        subtitle_text = self.text_cache.render(self.font, subtitle, WHITE)
+        restart_text = self.text_cache.render(self.small_font, restart_message, WHITE)
+        
+        # Center the text
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+        
+        # Draw shadows
+        if detailed:
+            title_shadow = self.text_cache.render(self.font, title, BLACK)
+            subtitle_shadow = self.text_cache.render(self.font, subtitle, BLACK)
+            restart_shadow = self.text_cache.render(self.small_font, restart_message, BLACK)
+            
+            self.screen.blit(title_shadow, (title_rect.x + 2, title_rect.y + 2))
+            self.screen.blit(subtitle_shadow, (subtitle_rect.x + 2, subtitle_rect.y + 2))
+            self.screen.blit(restart_shadow, (restart_rect.x + 2, restart_rect.y + 2))
+        
+        self.screen.blit(title_text, title_rect)
+        self.screen.blit(subtitle_text, subtitle_rect)
+        self.screen.blit(restart_text, restart_rect)
+    
+    def reset_game(self):
+        self.screen_shake = 0
+        self.sim.reset()
+        
+        # Clear particles and messages
+        if self.particle_system is not None:
+            self.particle_system.clear()
+        self.active_powerup_effects.clear()
+    
+    def handle_events(self):
+        # Returns False once the player asks to quit
+        running = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            
+            elif event.type == pygame.KEYDOWN:
+                if self.sim.game_over or self.sim.won:
+                    if event.key == pygame.K_SPACE:
+                        self.reset_game()
+                    elif event.key == pygame.K_ESCAPE:
+                        running = False
+                elif event.key == pygame.K_p:
+                    self.game_clock.toggle_pause()
+                elif event.key in KEY_DIRECTIONS and not self.game_clock.paused:
+                    self.sim.move(KEY_DIRECTIONS[event.key])
+        self.handle_sim_events()
+        return running
+    
+    def traffic_level(self):
+        # How busy the road around the frog is, 0..1, for the ambient track
+        frog = self.sim.frog
+        nearby = self.sim.traffic.colliding(frog.x - 200, frog.y - LANE_HEIGHT, 400, 2 * LANE_HEIGHT)
+        return min(1.0, len(nearby) / 4)
+    
+    def powerup_active(self):
+        frog = self.sim.frog
+        return frog.speed_boost or frog.invincible or frog.jump_boost or self.sim.traffic.world_factor < 1.0
+    
+    def update_mood(self):
+        # The ambient track only reads the mood once per block, so this runs
+        # once per frame, and not at all until the track is playing
+        if self.sound_manager.ambient is not None:
+            self.sound_manager.set_mood(self.traffic_level(), 1.0 if self.powerup_active() else 0.0)
+    
+    def update(self):
+        # Advance the game by one fixed simulation tick
+        if self.particle_system is not None and not self.sim.game_over and not self.sim.won:
+            # Update particles
+            self.particle_system.update()
+        
+        self.sim.step()
+        self.handle_sim_events()
+        
+        # Update screen shake
+        if self.screen_shake > 0:
+            self.screen_shake -= 1
+    
+    def draw(self, alpha=1.0):
+        # alpha is the fraction of a tick elapsed since the last update,
+        # used to interpolate moving entities between ticks
+        
+        # Calculate screen offset for shake effect
+        shake_x = random.randint(-self.screen_shake, self.screen_shake) if self.screen_shake > 0 else 0
+        shake_y = random.randint(-self.screen_shake, self.screen_shake) if self.screen_shake > 0 else 0
+        
+        # Shake and overlay frames repaint everything, as does the frame after one
+        overlay = self.sim.game_over or self.sim.won
+        full_redraw = not self.dirty_rects or self.full_redraw or overlay or self.screen_shake > 0
+        
+        # While shaking, the world is drawn off-screen and blitted at an offset
+        world = self.world_surface if self.screen_shake > 0 else self.screen
+        
+        # Draw everything
+        if full_redraw:
+            world.blit(self.background, (0, 0))
+        else:
+            # Restore the background under last frame's moving entities
+            for rect in self.previous_rects:
+                world.blit(self.background, rect, rect)
+        
+        current_rects = []
+        
+        # Draw power-ups
+        for powerup in self.sim.powerups:
+            current_rects.append(powerup.draw(world, self.sim.ticks))
+        
+        # Draw cars
+        current_rects.extend(self.draw_cars(world, alpha))
+        
+        # Draw particles
+        if self.particle_system is not None:
+            current_rects.extend(self.particle_system.draw(world))
+        
+        # Draw frog
+        if not self.sim.game_over and (self.variant.frog_after_win or not self.sim.won):
+            current_rects.append(self.sim.frog.draw(world))
+        
+        # Apply screen shake
+        if self.screen_shake > 0:
+            self.screen.fill(BLACK)
+            self.screen.blit(world, (shake_x, shake_y))
+        
+        # Draw UI (not affected by shake)
+        current_rects.extend(self.draw_ui())
+        
+        # Draw game over screen
+        if overlay:
+            self.draw_game_over()
+        
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous_rects + current_rects)
+        self.previous_rects = current_rects
+        self.full_redraw = overlay or self.screen_shake > 0
+    
+    def run(self):
+        running = True
+        frame_time = frogger_sim.TICK_TIME
+        
+        while running:
+            self.sound_manager.new_frame()
+            if self.particle_system is not None:
+                self.particle_system.new_frame()
+            running = self.handle_events()
+            
+            # Run as many fixed ticks as the elapsed game time covers
+            for _ in range(self.game_clock.ticks_for(frame_time)):
+                self.update()
+            self.update_mood()
+            
+            self.draw(self.game_clock.alpha() if self.interpolate else 1.0)
+            frame_time = self.clock.tick(0 if self.game_clock.fast else FPS) / 1000.0
+        
+        # Nothing may still be loading sounds or rendering sprites when
+        # pygame shuts down
+        self.warmup.cancel()
+        self.warmup.join()
+        self.sound_manager.stop()
+        pygame.quit()
+
+def main(game_class=Game):
+    # Command line shared by every entry point; --variant and the feature
+    # switches pick any combination, defaulting to game_class's variant
+    parser = argparse.ArgumentParser(description=game_class.variant.caption)
+    parser.add_argument("--variant", choices=VARIANTS,
+                        help="version of the game to play (default: this script's)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only send changed regions of the screen to the display")
+    parser.add_argument("--continuous-collision", action="store_true",
+                        help="sweep hops and car moves so nothing tunnels through")
+    parser.add_argument("--fast", action="store_true", help="run uncapped, one tick per frame")
+    parser.add_argument("--no-sound", action="store_true", help="never start the audio mixer")
+    parser.add_argument("--no-particles", action="store_true", help="turn particles off")
+    parser.add_argument("--no-screen-shake", action="store_true", help="turn screen shake off")
+    parser.add_argument("--powerups", action="store_true", help="add collectible power-ups")
+    args = parser.parse_args()
+    
+    variant = VARIANTS[args.variant] if args.variant else game_class.variant
+    features = {}
+    if args.no_particles:
+        features['particles'] = False
+    if args.no_screen_shake:
+        features['screen_shake'] = False
+    if args.powerups:
+        features['powerups'] = True
+    
+    game = game_class(dirty_rects=args.dirty_rects,
+                      continuous_collision=args.continuous_collision,
+                      fast=args.fast,
+                      sound=not args.no_sound,
+                      variant=variant.with_features(**features))
+    game.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import threading
+
+import numpy as np
+import pygame
+
+import frogger_audio
+
+def init_mixer():
+    # Start the mixer if there is an audio device; without one the game
+    # simply runs silently
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        print("Sound initialization failed - continuing without sound")
+        return False
+    return True
+
+class VoiceManager:
+    # Plays sounds on reserved mixer channels instead of letting pygame pick
+    # any free one, so a burst of sounds can never flood the mixer.
+    # Channels are split into named groups, and each sound has a group, a
+    # maximum number of simultaneous voices and a priority. A sound at its
+    # voice limit restarts its own oldest voice; otherwise it takes a free
+    # channel in its group, or steals the lowest-priority, oldest voice of
+    # no higher priority, or is dropped. At most frame_cap sounds start per
+    # frame.
+    def __init__(self, groups, voices, frame_cap=4):
+        # groups: group name -> channel count
+        # voices: sound name -> (group name, max voices, priority)
+        self.voices = voices
+        self.frame_cap = frame_cap
+        self.started = 0  # Sounds started this frame
+        self.serial = 0  # Start order, to find the oldest voice
+        self.playing = {}  # channel -> (sound name, priority, serial)
+        
+        # Reserve the first channels so Sound.play() elsewhere never uses them
+        total = sum(groups.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        self.groups = {}
+        first = 0
+        for group, count in groups.items():
+            self.groups[group] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            first += count
+    
+    def new_frame(self):
+        self.started = 0
+    
+    def play(self, name, sound):
+        # The channel the sound started on, or None if it was dropped
+        if self.started >= self.frame_cap:
+            return None
+        group, max_voices, priority = self.voices[name]
+        channels = self.groups[group]
+        busy = [channel for channel in channels if channel.get_busy() and channel in self.playing]
+        
+        same = [channel for channel in busy if self.playing[channel][0] == name]
+        if len(same) >= max_voices:
+            channel = min(same, key=lambda channel: self.playing[channel][2])
+        else:
+            channel = next((channel for channel in channels if channel not in busy), None)
+            if channel is None:
+                # Steal from the least important, oldest voice
+                stealable = [channel for channel in busy if self.playing[channel][1] <= priority]
+                if not stealable:
+                    return None
+                channel = min(stealable, key=lambda channel: self.playing[channel][1:])
+        
+        channel.play(sound)  # Stops whatever the channel was playing
+        self.serial += 1
+        self.playing[channel] = (name, priority, self.serial)
+        self.started += 1
+        return channel
+    
+    def voice_count(self, name=None):
+        # Voices playing, of one sound or of all sounds
+        return sum(1 for channel, voice in self.playing.items()
+                   if channel.get_busy() and (name is None or voice[0] == name))
+
+class AmbientStream:
+    # Endless ambient track generated block by block on a background thread
+    # and fed to one mixer channel through its queue. Only the playing block
+    # and the queued one exist at any time, so memory does not grow with
+    # the length of the track. set_mood() changes the soundscape; the new
+    # levels fade in over the next block.
+    def __init__(self, channel, block_time=0.25):
+        self.channel = channel
+        sample_rate, _, self.channels = pygame.mixer.get_init()
+        self.sample_rate = sample_rate
+        self.block = int(block_time * sample_rate)
+        self.position = 0  # Absolute sample index of the next block
+        self.traffic = 0.0
+        self.powerup = 0.0
+        self.levels = (0.0, 0.0)  # traffic and powerup at the end of the last block
+        self.running = False
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()  # So stop() never sees a thread not yet started
+    
+    def set_mood(self, traffic=0.0, powerup=0.0):
+        # Levels in 0..1: how busy the nearby road is, and whether a power-up is active
+        self.traffic = traffic
+        self.powerup = powerup
+    
+    def start(self):
+        with self.lock:
+            self.running = True
+            self.thread = threading.Thread(target=self.run, name="ambient", daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        with self.lock:
+            self.running = False
+            self.wakeup.set()
+            thread = self.thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        self.channel.stop()
+    
+    def next_block(self):
+        i = np.arange(self.position, self.position + self.block)
+        self.position += self.block
+        traffic, powerup = self.traffic, self.powerup
+        wave = frogger_audio.ambient_block(i, self.sample_rate, (self.levels[0], traffic),
+                                           (self.levels[1], powerup))
+        self.levels = (traffic, powerup)
+        return pygame.sndarray.make_sound(frogger_audio.to_samples(wave, self.channels))
+    
+    def run(self):
+        # Keep one block queued behind the one playing, checking a few times
+        # per block so the queue never runs dry
+        poll = self.block / self.sample_rate / 4
+        try:
+            while self.running:
+                if not self.channel.get_busy():
+                    self.channel.play(self.next_block())
+                if self.channel.get_queue() is None:
+                    self.channel.queue(self.next_block())
+                self.wakeup.wait(poll)
+        except pygame.error:
+            pass  # The mixer was shut down under us
@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pygame
+
+# Dust kicked up by the frog's hops
+BROWN = (139, 69, 19)
+
+class ParticleSystem:
+    # Every particle stored as one slot in fixed-size NumPy arrays used as a
+    # ring buffer: new particles overwrite the oldest slots, so bursts never
+    # allocate and the particle count can never exceed the capacity. At most
+    # budget particles are spawned per rendered frame (the game calls
+    # new_frame()); the rest of a burst is dropped.
+    def __init__(self, capacity=512, budget=64):
+        self.capacity = capacity
+        self.budget = budget
+        self.spawned = 0  # Particles spawned this frame
+        self.next = 0  # Ring slot the next particle is written to
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=int)  # 0 for free slots
+        self.max_life = np.ones(capacity, dtype=int)
+        self.size = np.zeros(capacity, dtype=int)
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        # Seeded from random so seeded games replay the same particles
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        # Pre-rendered circles keyed by radius and color packed in an int
+        self.sprites = {}
+    
+    def emit(self, x, y, color, count, velocity_x, velocity_y, life):
+        # Spawn count particles at (x, y) with velocities and lifetimes drawn
+        # uniformly from the given (low, high) ranges
+        count = min(count, self.budget - self.spawned)
+        if count <= 0:
+            return
+        self.spawned += count
+        slots = (self.next + np.arange(count)) % self.capacity
+        self.next = (self.next + count) % self.capacity
+        
+        rng = self.rng
+        self.x[slots] = x
+        self.y[slots] = y
+        self.velocity_x[slots] = rng.uniform(*velocity_x, count)
+        self.velocity_y[slots] = rng.uniform(*velocity_y, count)
+        self.life[slots] = self.max_life[slots] = rng.integers(life[0], life[1] + 1, count)
+        self.size[slots] = rng.integers(2, 6, count)
+        self.colors[slots] = color
+    
+    def add_explosion(self, x, y, color, count=10):
+        self.emit(x, y, color, count, (-3, 3), (-5, -1), (30, 60))
+    
+    def add_dust(self, x, y, count=5):
+        self.emit(x, y, BROWN, count, (-1, 1), (-2, 0), (20, 40))
+    
+    def add_powerup_effect(self, x, y, color, count=15):
+        self.emit(x, y, color, count, (-2, 2), (-3, -1), (40, 80))
+    
+    def new_frame(self):
+        self.spawned = 0
+    
+    def clear(self):
+        self.life[:] = 0
+        self.spawned = 0
+    
+    def count(self):
+        return int(np.count_nonzero(self.life))
+    
+    def update(self):
+        live = self.life > 0
+        self.x[live] += self.velocity_x[live]
+        self.y[live] += self.velocity_y[live]
+        self.velocity_y[live] += 0.1  # Gravity
+        self.life[live] -= 1
+    
+    def draw(self, screen):
+        # Oldest first, so newer particles are drawn on top
+        order = (self.next + np.arange(self.capacity)) % self.capacity
+        order = order[self.life[order] > 0]
+        
+        # Particles shrink as they fade
+        size = self.size[order] * self.life[order] // self.max_life[order]
+        order, size = order[size > 0], size[size > 0]
+        
+        # One sprite key per particle, radius and 24-bit color packed in an int
+        colors = self.colors[order].astype(np.int64)
+        keys = (size << 24 | colors[:, 0] << 16 | colors[:, 1] << 8 | colors[:, 2]).tolist()
+        sprites = self.sprites
+        for key in set(keys).difference(sprites):
+            sprites[key] = render_sprite(key)
+        
+        # Blit every particle's circle sprite in one call
+        left = (self.x[order].astype(int) - size).tolist()
+        top = (self.y[order].astype(int) - size).tolist()
+        return screen.blits([(sprites[key], (left[i], top[i])) for i, key in enumerate(keys)])
+
+def render_sprite(key):
+    # Circle for a packed (radius, color) key, with the same pixels as
+    # pygame.draw.circle centered on the sprite's middle
+    radius = key >> 24
+    color = (key >> 16 & 255, key >> 8 & 255, key & 255)
+    sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    return sprite
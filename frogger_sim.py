@@ -0,0 +1,507 @@
+import argparse
+import heapq
+import itertools
+import random
+import time
+
+from frogger_traffic import LaneIndex, Traffic
+
+# Playfield and rules shared by every front end
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+TICK_RATE = 60  # Fixed simulation ticks per second
+TICK_TIME = 1.0 / TICK_RATE
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on
+
+FROG_SIZE = 30
+CAR_WIDTH = 60
+CAR_HEIGHT = 30
+FROG_SPEED = 40
+ROAD_LANES = 5
+LANE_HEIGHT = 80
+
+# Width and height for each car_type: 0=car, 1=truck, 2=sports car
+CAR_SIZES = {
+    0: (CAR_WIDTH, CAR_HEIGHT),
+    1: (CAR_WIDTH + 20, CAR_HEIGHT + 5),
+    2: (CAR_WIDTH - 10, CAR_HEIGHT - 5)
+}
+
+def overlaps(a, b):
+    # (left, top, width, height) rects overlap, following pygame.Rect.colliderect
+    return (a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and
+            a[1] < b[1] + b[3] and b[1] < a[1] + a[3])
+
+class GameClock:
+    # Game time in seconds. It only moves when the simulation ticks, so it
+    # stops while paused, follows the time scale, and in fast mode runs as
+    # quickly as ticks can be computed instead of following real time.
+    def __init__(self, scale=1.0, fast=False):
+        self.time = 0.0
+        self.scale = scale  # Game seconds per real second
+        self.fast = fast
+        self.paused = False
+        self.accumulator = 0.0  # Scaled real time not yet simulated
+    
+    def now(self):
+        return self.time
+    
+    def advance(self, seconds):
+        self.time += seconds
+    
+    def toggle_pause(self):
+        self.paused = not self.paused
+    
+    def ticks_for(self, frame_time):
+        # How many fixed ticks to run for a frame that took frame_time real
+        # seconds; fast mode runs one tick per frame however long it took
+        if self.paused:
+            return 0
+        if self.fast:
+            return 1
+        ticks = 0
+        self.accumulator += min(frame_time, MAX_FRAME_TIME) * self.scale
+        while self.accumulator >= TICK_TIME:
+            self.accumulator -= TICK_TIME
+            ticks += 1
+        return ticks
+    
+    def alpha(self):
+        # Fraction of a tick elapsed since the last one, for interpolation
+        return 1.0 if self.fast else self.accumulator / TICK_TIME
+
+class Timers:
+    # Pending expiry callbacks in a heap ordered by due time, so each tick only
+    # looks at the timers that fire rather than polling every entity
+    def __init__(self):
+        self.heap = []  # [due, sequence, callback, args]
+        self.sequence = itertools.count()  # Keeps equal due times in schedule order
+    
+    def schedule(self, due, callback, *args):
+        # Returns a handle that can be passed to cancel
+        timer = [due, next(self.sequence), callback, args]
+        heapq.heappush(self.heap, timer)
+        return timer
+    
+    def cancel(self, timer):
+        # Cancelled timers stay in the heap and are skipped when they come due
+        timer[2] = None
+    
+    def clear(self):
+        self.heap.clear()
+    
+    def run(self, now):
+        # Fire every timer that is past due, earliest first
+        heap = self.heap
+        while heap and heap[0][0] < now:
+            _, _, callback, args = heapq.heappop(heap)
+            if callback is not None:
+                callback(*args)
+
+class Frog:
+    __slots__ = ('x', 'y', 'start_y', 'hop_animation', 'direction',
+                 'speed_boost', 'speed_boost_end', 'invincible', 'invincible_end',
+                 'jump_boost', 'jump_boost_end', 'jump_boost_uses')
+    size = FROG_SIZE
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.start_y = y
+        self.hop_animation = 0
+        self.direction = 0  # 0=up, 1=right, 2=down, 3=left
+        
+        # Power-up effects
+        self.speed_boost = False
+        self.speed_boost_end = 0
+        self.invincible = False
+        self.invincible_end = 0
+        self.jump_boost = False
+        self.jump_boost_end = 0
+        self.jump_boost_uses = 0
+    
+    def apply_powerup(self, power_type, now):
+        # Returns when the effect ends; the caller schedules end_powerup for then
+        if power_type == 0:  # Speed boost
+            self.speed_boost = True
+            self.speed_boost_end = now + 10  # 10 seconds
+            return self.speed_boost_end
+        elif power_type == 1:  # Invincibility
+            self.invincible = True
+            self.invincible_end = now + 8  # 8 seconds
+            return self.invincible_end
+        elif power_type == 4:  # Jump boost
+            self.jump_boost = True
+            self.jump_boost_end = now + 15  # 15 seconds
+            self.jump_boost_uses = 3  # 3 double jumps
+            return self.jump_boost_end
+    
+    def end_powerup(self, power_type):
+        if power_type == 0:  # Speed boost
+            self.speed_boost = False
+        elif power_type == 1:  # Invincibility
+            self.invincible = False
+        elif power_type == 4:  # Jump boost
+            self.jump_boost = False
+            self.jump_boost_uses = 0
+    
+    def clear_powerups(self):
+        self.speed_boost = False
+        self.invincible = False
+        self.jump_boost = False
+    
+    def move_up(self):
+        move_distance = FROG_SPEED * 2 if self.speed_boost else FROG_SPEED
+        
+        if self.y > LANE_HEIGHT:
+            self.y -= move_distance
+            self.direction = 0
+            self.hop_animation = 10
+            return True
+        return False
+    
+    def move_down(self):
+        move_distance = FROG_SPEED * 2 if self.speed_boost else FROG_SPEED
+        
+        if self.y < SCREEN_HEIGHT - LANE_HEIGHT:
+            self.y += move_distance
+            self.direction = 2
+            self.hop_animation = 10
+            return True
+        return False
+    
+    def move_left(self):
+        move_distance = FROG_SPEED * 2 if self.speed_boost else FROG_SPEED
+        
+        if self.x > self.size // 2:
+            self.x -= move_distance
+            self.direction = 3
+            self.hop_animation = 10
+            return True
+        return False
+    
+    def move_right(self):
+        move_distance = FROG_SPEED * 2 if self.speed_boost else FROG_SPEED
+        
+        if self.x < SCREEN_WIDTH - self.size // 2:
+            self.x += move_distance
+            self.direction = 1
+            self.hop_animation = 10
+            return True
+        return False
+    
+    def reset_position(self):
+        self.x = SCREEN_WIDTH // 2
+        self.y = self.start_y
+        self.hop_animation = 0
+        # Keep power-ups when respawning
+    
+    def update(self):
+        if self.hop_animation > 0:
+            self.hop_animation -= 1
+    
+    def get_rect(self):
+        return (self.x - self.size // 2, self.y - self.size // 2, self.size, self.size)
+
+class PowerUp:
+    __slots__ = ('x', 'y', 'power_type', 'collected', 'spawn_time', 'spawn_tick')
+    # Half the side of the pickup rect
+    size = 20
+    duration = 30  # seconds before disappearing
+    
+    def __init__(self, x, y, power_type, spawn_time, spawn_tick=0):
+        self.x = x
+        self.y = y
+        self.power_type = power_type  # 0=speed, 1=invincibility, 2=extra_life, 3=slow_cars, 4=jump_boost
+        self.collected = False
+        self.spawn_time = spawn_time
+        self.spawn_tick = spawn_tick  # Simulation tick it appeared on, for animation
+    
+    def get_rect(self):
+        return (self.x - self.size, self.y - self.size, self.size * 2, self.size * 2)
+    
+    def collect(self):
+        self.collected = True
+
+class Simulation:
+    # The rules of the game (frog movement, traffic, power-ups, lives, scoring,
+    # win/lose) with no display, mixer or event queue. step() advances one fixed
+    # tick; anything a front end should show or play is queued in events.
+    def __init__(self, car_colors, car_types=False, powerups=False, continuous_collision=False,
+                 clock=None, frog_class=Frog, powerup_class=PowerUp):
+        self.car_colors = car_colors
+        self.car_types = car_types
+        self.with_powerups = powerups
+        self.continuous_collision = continuous_collision
+        self.powerup_class = powerup_class
+        
+        # Everything timed (score, power-ups, effects) reads the game clock,
+        # which advances only while a game is being played
+        self.ticks = 0
+        self.clock = clock or GameClock()
+        
+        # ('hop', x, y), ('collision', x, y), ('win', x, y) and ('powerup', powerup)
+        self.events = []
+        
+        # Expiry of power-ups and their effects, and the next power-up spawn
+        self.timers = Timers()
+        self.effect_timers = {}  # power_type -> pending end of its effect
+        
+        # Game state
+        self.lives = 3
+        self.start_time = self.now()
+        self.game_over = False
+        self.won = False
+        self.score = 0
+        
+        # Create frog
+        self.frog = frog_class(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
+        self.frog_previous = (self.frog.x, self.frog.y)
+        
+        # Create cars
+        self.traffic = Traffic(SCREEN_WIDTH)
+        self.create_cars()
+        
+        # Power-ups
+        self.powerups = []
+        self.powerup_index = LaneIndex(LANE_HEIGHT)
+        self.powerup_spawn_interval = 15  # seconds
+        self.schedule_spawn()
+    
+    def now(self):
+        return self.clock.now()
+    
+    def elapsed(self):
+        return self.now() - self.start_time
+    
+    def drain_events(self):
+        events = self.events
+        self.events = []
+        return events
+    
+    def create_cars(self):
+        for lane in range(ROAD_LANES):
+            lane_y = LANE_HEIGHT + (lane + 1) * LANE_HEIGHT
+            
+            # Alternate direction for each lane
+            if lane % 2 == 0:
+                speed = random.uniform(2, 4)
+                num_cars = random.randint(2, 4)
+            else:
+                speed = -random.uniform(2, 4)
+                num_cars = random.randint(2, 4)
+            
+            for i in range(num_cars):
+                if speed > 0:
+                    x = -CAR_WIDTH - i * 200
+                else:
+                    x = SCREEN_WIDTH + i * 200
+                
+                color = random.choice(self.car_colors)
+                car_type = random.randint(0, 2) if self.car_types else 0
+                width, height = CAR_SIZES[car_type]
+                self.traffic.add_car(x, lane_y, speed, width, height, color, car_type)
+    
+    def move(self, direction):
+        # Hop the frog one step: 0=up, 1=right, 2=down, 3=left
+        if self.game_over or self.won:
+            return False
+        frog = self.frog
+        moved = (frog.move_up, frog.move_right, frog.move_down, frog.move_left)[direction]()
+        if moved:
+            self.events.append(('hop', frog.x, frog.y))
+        return moved
+    
+    def schedule_spawn(self):
+        if self.with_powerups:
+            self.timers.schedule(self.now() + self.powerup_spawn_interval, self.spawn_powerup)
+    
+    def schedule_effect(self, power_type, until, callback, *args):
+        # One pending end per effect; collecting it again moves the deadline
+        previous = self.effect_timers.get(power_type)
+        if previous:
+            self.timers.cancel(previous)
+        self.effect_timers[power_type] = self.timers.schedule(until, callback, *args)
+    
+    def spawn_powerup(self):
+        # Spawn power-up in a safe location
+        safe_zones = [
+            (random.randint(50, SCREEN_WIDTH - 50), random.randint(20, LANE_HEIGHT - 20)),
+            (random.randint(50, SCREEN_WIDTH - 50), random.randint(SCREEN_HEIGHT - LANE_HEIGHT + 20, SCREEN_HEIGHT - 50))
+        ]
+        
+        # Also spawn on road (more risky but accessible)
+        for lane in range(ROAD_LANES):
+            lane_y = LANE_HEIGHT + (lane + 1) * LANE_HEIGHT
+            safe_zones.append((random.randint(100, SCREEN_WIDTH - 100), lane_y))
+        
+        spawn_pos = random.choice(safe_zones)
+        power_type = random.randint(0, 4)  # 5 different power-up types
+        
+        powerup = self.powerup_class(spawn_pos[0], spawn_pos[1], power_type, self.now(), self.ticks)
+        self.powerups.append(powerup)
+        self.powerup_index.add(powerup)
+        self.timers.schedule(powerup.spawn_time + powerup.duration, self.expire_powerup, powerup)
+        self.schedule_spawn()
+    
+    def expire_powerup(self, powerup):
+        # Collected power-ups are already gone
+        if not powerup.collected:
+            self.powerups.remove(powerup)
+            self.powerup_index.remove(powerup)
+    
+    def check_powerup_collection(self):
+        frog_rect = self.frog.get_rect()
+        # Only power-ups in the frog's lanes and near its x can be touching it
+        nearby = self.powerup_index.query(*frog_rect, reach=self.powerup_class.size)
+        for powerup in nearby:
+            if not powerup.collected and overlaps(frog_rect, powerup.get_rect()):
+                self.collect_powerup(powerup)
+    
+    def collect_powerup(self, powerup):
+        powerup.collect()
+        
+        # Apply power-up effect
+        now = self.now()
+        if powerup.power_type == 2:  # Extra life
+            self.lives += 1
+        elif powerup.power_type == 3:  # Slow cars
+            self.traffic.set_slow_factor(0.3)
+            self.schedule_effect(3, now + 8, self.traffic.set_slow_factor, 1.0)  # 8 seconds
+        else:  # Speed boost, invincibility or jump boost
+            until = self.frog.apply_powerup(powerup.power_type, now)
+            self.schedule_effect(powerup.power_type, until, self.frog.end_powerup, powerup.power_type)
+        
+        self.score += 100  # Bonus points for collecting power-up
+        
+        # Remove collected power-up
+        self.powerups.remove(powerup)
+        self.powerup_index.remove(powerup)
+        self.events.append(('powerup', powerup))
+    
+    def check_collision(self):
+        if self.frog.invincible:
+            return False
+        
+        left, top, width, height = self.frog.get_rect()
+        if self.continuous_collision:
+            # Sweep the frog from where the last tick left it
+            start_x, start_y = self.frog_previous
+            half = self.frog.size // 2
+            impact = self.traffic.sweep(start_x - half, start_y - half, left, top, width, height)
+            return impact is not None
+        return self.traffic.collides(left, top, width, height)
+    
+    def check_win(self):
+        return self.frog.y <= LANE_HEIGHT
+    
+    def handle_collision(self):
+        self.events.append(('collision', self.frog.x, self.frog.y))
+        self.lives -= 1
+        self.frog.reset_position()
+        
+        if self.lives <= 0:
+            self.game_over = True
+    
+    def get_score(self):
+        seconds = int(self.elapsed())
+        if self.with_powerups:
+            # Bonus points plus a bonus for crossing quickly
+            return self.score + max(0, 1000 - seconds * 10)
+        return seconds
+    
+    def reset(self):
+        self.lives = 3
+        self.start_time = self.now()
+        self.game_over = False
+        self.won = False
+        self.score = 0
+        self.events.clear()
+        self.frog.reset_position()
+        self.frog.clear_powerups()
+        self.frog_previous = (self.frog.x, self.frog.y)
+        
+        # Reset power-ups
+        self.powerups.clear()
+        self.powerup_index.clear()
+        self.timers.clear()
+        self.effect_timers.clear()
+        self.schedule_spawn()
+        
+        # Reset cars
+        self.traffic.clear()
+        self.create_cars()
+    
+    def step(self):
+        # Advance the rules by one fixed simulation tick
+        if not self.game_over and not self.won:
+            # Expire power-ups and effects, and spawn new power-ups
+            self.timers.run(self.now())
+            
+            # Update frog and cars
+            self.frog.update()
+            self.traffic.update()
+            
+            # Check power-up collection
+            if self.with_powerups:
+                self.check_powerup_collection()
+            
+            # Check for collision
+            if self.check_collision():
+                self.handle_collision()
+            
+            # Check for win
+            if self.check_win():
+                self.won = True
+                if self.with_powerups:
+                    self.score += 500  # Bonus for winning
+                self.events.append(('win', self.frog.x, self.frog.y))
+            
+            self.clock.advance(TICK_TIME)
+        
+        # The next tick sweeps the frog from where this one left it
+        self.frog_previous = (self.frog.x, self.frog.y)
+        self.ticks += 1
+
+def random_policy(sim):
+    # A test player: every few ticks hop, mostly forward
+    if sim.ticks % 8 == 0:
+        return random.choice((0, 0, 0, 1, 2, 3))
+    return None
+
+def play(sim, policy=random_policy, max_ticks=TICK_RATE * 120):
+    # Run one game to the end (or max_ticks) and return how many ticks it took
+    sim.reset()
+    start = sim.ticks
+    for _ in range(max_ticks):
+        direction = policy(sim)
+        if direction is not None:
+            sim.move(direction)
+        sim.step()
+        sim.events.clear()
+        if sim.game_over or sim.won:
+            break
+    return sim.ticks - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Frogger games headlessly and report the results")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--powerups", action="store_true")
+    parser.add_argument("--continuous-collision", action="store_true")
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    sim = Simulation(list(range(6)), car_types=True, powerups=args.powerups,
+                     continuous_collision=args.continuous_collision)
+    wins = ticks = score = 0
+    start = time.perf_counter()
+    for _ in range(args.games):
+        ticks += play(sim)
+        wins += sim.won
+        score += sim.get_score()
+    seconds = time.perf_counter() - start
+    
+    print(f"{args.games} games in {seconds:.2f}s ({args.games / seconds * 60:.0f} games/min)")
+    print(f"win rate {wins / args.games:.1%}, mean score {score / args.games:.1f}, "
+          f"mean length {ticks / args.games / TICK_RATE:.1f}s")
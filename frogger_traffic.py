@@ -0,0 +1,273 @@
+import bisect
+
+import numpy as np
+
+class LaneIndex:
+    # Buckets objects with x/y anchors by lane, sorted by x within each lane,
+    # so a rect query only visits the lanes it overlaps and objects near its x
+    def __init__(self, lane_height):
+        self.lane_height = lane_height
+        self.lanes = {}  # lane number -> ([x, ...], [object, ...])
+    
+    def lane_of(self, y):
+        return int(y // self.lane_height)
+    
+    def add(self, obj):
+        xs, objects = self.lanes.setdefault(self.lane_of(obj.y), ([], []))
+        i = bisect.bisect_right(xs, obj.x)
+        xs.insert(i, obj.x)
+        objects.insert(i, obj)
+    
+    def remove(self, obj):
+        xs, objects = self.lanes[self.lane_of(obj.y)]
+        i = objects.index(obj)
+        del xs[i]
+        del objects[i]
+    
+    def clear(self):
+        self.lanes.clear()
+    
+    def query(self, left, top, width, height, reach=0):
+        # Objects anchored within reach of the rect; callers do the exact test
+        found = []
+        for lane in range(self.lane_of(top - reach), self.lane_of(top + height + reach) + 1):
+            bucket = self.lanes.get(lane)
+            if bucket:
+                xs, objects = bucket
+                lo = bisect.bisect_left(xs, left - reach)
+                hi = bisect.bisect_right(xs, left + width + reach)
+                found.extend(objects[lo:hi])
+        return found
+
+class Traffic:
+    # Every car on the road stored as one NumPy array per attribute, so that
+    # movement, wrapping and collision tests run as single vectorized operations.
+    # Cars are laid out lane by lane and sorted by x within each lane, so a
+    # collision query only touches the lanes and cars near the queried rect.
+    arrays = ('x', 'previous_x', 'y', 'width', 'height', 'speed')
+    
+    def __init__(self, screen_width, capacity=64):
+        self.screen_width = screen_width
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.previous_x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.width = np.zeros(capacity)
+        self.height = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        
+        # Render-only attributes, indexed like the arrays
+        self.colors = []
+        self.car_types = []
+        
+        # Lane layout: lane_starts[i]:lane_starts[i + 1] holds the cars of lane_ys[i]
+        self.lane_ys = []
+        self.lane_starts = [0]
+        self.lane_counts = np.zeros(0, dtype=int)
+        self.same_lane = np.zeros(0, dtype=bool)
+        self.max_width = 0
+        self.max_height = 0
+        self.max_speed = 0
+        self.index_dirty = False
+        
+        # Time dilation: every car moves at speed times the world factor times
+        # its lane's factor, so slowing traffic never touches individual cars
+        self.world_factor = 1.0
+        self.lane_factors = {}  # lane y -> factor, for lanes not at 1.0
+    
+    def grow(self):
+        # Double the capacity of every array (from at least one car), keeping the existing cars
+        for name in Traffic.arrays:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros(max(1, len(array)))]))
+    
+    def add_car(self, x, y, speed, width, height, color, car_type=0):
+        if self.count == len(self.x):
+            self.grow()
+        i = self.count
+        self.x[i] = x
+        self.previous_x[i] = x
+        self.y[i] = y
+        self.width[i] = width
+        self.height[i] = height
+        self.speed[i] = speed
+        self.colors.append(color)
+        self.car_types.append(car_type)
+        self.count += 1
+        self.max_width = max(self.max_width, width)
+        self.max_height = max(self.max_height, height)
+        self.max_speed = max(self.max_speed, abs(speed))
+        self.index_dirty = True
+    
+    def clear(self):
+        self.count = 0
+        self.colors.clear()
+        self.car_types.clear()
+        self.max_width = 0
+        self.max_height = 0
+        self.max_speed = 0
+        self.index_dirty = True
+        self.world_factor = 1.0
+        self.lane_factors.clear()
+    
+    def permute(self, start, order):
+        # Reorder the cars in start:start + len(order) to the given car indices
+        end = start + len(order)
+        for name in Traffic.arrays:
+            array = getattr(self, name)
+            array[start:end] = array[order]
+        order = order.tolist()
+        self.colors[start:end] = [self.colors[i] for i in order]
+        self.car_types[start:end] = [self.car_types[i] for i in order]
+    
+    def build_index(self):
+        # Group cars by lane and sort each lane by x
+        n = self.count
+        self.permute(0, np.lexsort((self.x[:n], self.y[:n])))
+        lane_ys, starts = np.unique(self.y[:n], return_index=True)
+        self.lane_ys = lane_ys.tolist()
+        self.lane_starts = starts.tolist() + [n]
+        self.lane_counts = np.diff(self.lane_starts)
+        self.same_lane = np.diff(self.y[:n]) == 0
+        self.index_dirty = False
+    
+    def sort_lanes(self, lanes):
+        for lane in lanes:
+            start, end = self.lane_starts[lane], self.lane_starts[lane + 1]
+            self.permute(start, start + np.argsort(self.x[start:end], kind='stable'))
+    
+    def update(self):
+        if self.index_dirty:
+            self.build_index()
+        n = self.count
+        x = self.x[:n]
+        speed = self.speed[:n]
+        width = self.width[:n]
+        
+        self.previous_x[:n] = x
+        if self.world_factor == 1.0 and not self.lane_factors:
+            x += speed
+        else:
+            x += speed * np.repeat(self.factors(), self.lane_counts)
+        
+        # Reset cars to the other side when they go off screen
+        off_right = (speed > 0) & (x > self.screen_width + width)
+        off_left = (speed < 0) & (x < -width)
+        x[off_right] = -width[off_right]
+        x[off_left] = self.screen_width + width[off_left]
+        
+        # Wrapped cars jump rather than interpolate across the screen
+        wrapped = off_right | off_left
+        self.previous_x[:n][wrapped] = x[wrapped]
+        
+        # Re-sort only the lanes where a car wrapped or overtook another
+        out_of_order = np.flatnonzero((np.diff(x) < 0) & self.same_lane)
+        if len(out_of_order):
+            lanes = np.searchsorted(self.lane_starts, out_of_order, side='right') - 1
+            self.sort_lanes(np.unique(lanes).tolist())
+    
+    def set_slow_factor(self, factor, lane_y=None):
+        # Scale the speed of one lane (by its y) or, with no lane, the whole road
+        if lane_y is None:
+            self.world_factor = factor
+        elif factor == 1.0:
+            self.lane_factors.pop(lane_y, None)
+        else:
+            self.lane_factors[lane_y] = factor
+    
+    def factors(self):
+        # Combined speed factor of each lane, in lane order
+        if self.index_dirty:
+            self.build_index()
+        return np.array([self.world_factor * self.lane_factors.get(y, 1.0) for y in self.lane_ys])
+    
+    def slowed(self):
+        # Whether each car is in a slowed lane
+        return np.repeat(self.factors() < 1.0, self.lane_counts)
+    
+    def tops(self):
+        return self.y[:self.count] - self.height[:self.count] // 2
+    
+    def nearby(self, left, top, right, bottom, reach=0):
+        # Slices of cars that may overlap the area, allowing cars to be up to
+        # reach pixels away horizontally (e.g. how far they move in a tick)
+        if self.index_dirty:
+            self.build_index()
+        
+        # Only the lanes whose cars can reach the area vertically
+        first = bisect.bisect_left(self.lane_ys, top - self.max_height)
+        last = bisect.bisect_right(self.lane_ys, bottom + self.max_height)
+        for lane in range(first, last):
+            start, end = self.lane_starts[lane], self.lane_starts[lane + 1]
+            
+            # Only the cars that start within one car length of the area
+            lane_x = self.x[start:end]
+            lo = start + np.searchsorted(lane_x, left - self.max_width - reach - 1, side='right')
+            hi = start + np.searchsorted(lane_x, right + reach)
+            if lo < hi:
+                yield lo, hi
+    
+    def colliding(self, left, top, width, height):
+        # Indices of cars whose rect overlaps the given one, following
+        # pygame.Rect.colliderect (car rects truncate x like pygame.Rect does)
+        hits = []
+        for lo, hi in self.nearby(left, top, left + width, top + height):
+            car_left = np.trunc(self.x[lo:hi])
+            car_top = self.y[lo:hi] - self.height[lo:hi] // 2
+            overlap = ((car_left < left + width) & (left < car_left + self.width[lo:hi]) &
+                       (car_top < top + height) & (top < car_top + self.height[lo:hi]))
+            hits.append(lo + np.flatnonzero(overlap))
+        
+        return np.concatenate(hits) if hits else np.zeros(0, dtype=int)
+    
+    def sweep(self, start_left, start_top, end_left, end_top, width, height):
+        # Continuous collision over the last tick: the rect moves from its start
+        # to its end position while every car moves from previous_x to x.
+        # Returns (time of impact in 0..1, car index) for the earliest hit, or None.
+        left, right = min(start_left, end_left), max(start_left, end_left) + width
+        top, bottom = min(start_top, end_top), max(start_top, end_top) + height
+        move_x, move_y = end_left - start_left, end_top - start_top
+        
+        earliest = None
+        for lo, hi in self.nearby(left, top, right, bottom, reach=self.max_speed):
+            car_width = self.width[lo:hi]
+            car_height = self.height[lo:hi]
+            car_top = self.y[lo:hi] - car_height // 2
+            
+            # Position and velocity of each car relative to the rect
+            offset_x = self.previous_x[lo:hi] - start_left
+            offset_y = car_top - start_top
+            velocity_x = (self.x[lo:hi] - self.previous_x[lo:hi]) - move_x
+            velocity_y = np.full(hi - lo, -move_y, dtype=float)
+            
+            enter_x, exit_x = overlap_times(offset_x, velocity_x, car_width, width)
+            enter_y, exit_y = overlap_times(offset_y, velocity_y, car_height, height)
+            enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+            leave = np.minimum(np.minimum(exit_x, exit_y), 1.0)
+            
+            hit = np.flatnonzero(enter < leave)
+            if len(hit):
+                first = hit[np.argmin(enter[hit])]
+                if earliest is None or enter[first] < earliest[0]:
+                    earliest = (float(enter[first]), int(lo + first))
+        
+        return earliest
+    
+    def collides(self, left, top, width, height):
+        return len(self.colliding(left, top, width, height)) > 0
+
+def overlap_times(offset, velocity, car_size, size):
+    # Time interval during which a car at offset (relative to a rect of the
+    # given size) moving at velocity per tick overlaps the rect on one axis
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t1 = (-car_size - offset) / velocity
+        t2 = (size - offset) / velocity
+    enter = np.minimum(t1, t2)
+    leave = np.maximum(t1, t2)
+    
+    # Cars not moving on this axis overlap for all time or never
+    still = velocity == 0
+    overlapping = (-car_size < offset) & (offset < size)
+    enter[still] = np.where(overlapping[still], -np.inf, np.inf)
+    leave[still] = np.where(overlapping[still], np.inf, -np.inf)
+    return enter, leave
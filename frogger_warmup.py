@@ -0,0 +1,41 @@
+import threading
+
+class Warmup:
+    # Prepares assets on a background thread so the window can show its first
+    # frame right away. Tasks are (label, callable) pairs run in order; the
+    # game checks finished() and shows status() until they are all done.
+    # cancel() skips the tasks not yet started, e.g. when the game quits.
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.done = 0
+        self.cancelled = False
+        self.thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+        self.thread.start()
+    
+    def run(self):
+        for label, task in self.tasks:
+            if self.cancelled:
+                break
+            try:
+                task()
+            except Exception as error:
+                print(f"Could not prepare {label} ({error}) - continuing without it")
+            self.done += 1
+    
+    def finished(self):
+        return self.done == len(self.tasks)
+    
+    def status(self):
+        # Loading indicator text for the task in progress
+        done = self.done  # Read once; the warmup thread keeps counting
+        if done == len(self.tasks):
+            return ""
+        return f"Loading {self.tasks[done][0]}... {done}/{len(self.tasks)}"
+    
+    def cancel(self):
+        # The task in progress still finishes; join() to wait for it
+        self.cancelled = True
+    
+    def join(self, timeout=None):
+        # Wait for every task, e.g. before measuring or in tools
+        self.thread.join(timeout)
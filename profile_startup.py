@@ -0,0 +1,193 @@
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+class StartupProfiler:
+    # Wall time, CPU time and net allocations of named startup phases.
+    # Phases may nest (each is measured inclusively) and may repeat, in
+    # which case their calls are summed under one name. CPU time is the
+    # phase's own thread's, but tracemalloc counts every thread, so a phase
+    # that ran while a phase on another thread was open is marked
+    # concurrent: its allocations include that thread's work.
+    def __init__(self, allocations=True):
+        self.allocations = allocations
+        # name -> [wall, cpu, allocated bytes, calls, concurrent], in first-seen order
+        self.phases = {}
+        self.open = []  # (thread ident, record) of the phases in progress
+        if allocations:
+            tracemalloc.start()
+    
+    @contextmanager
+    def phase(self, name):
+        record = self.phases.setdefault(name, [0.0, 0.0, 0, 0, False])
+        thread = threading.get_ident()
+        for other_thread, other in list(self.open):
+            if other_thread != thread:
+                other[4] = record[4] = True
+        opened = (thread, record)
+        self.open.append(opened)
+        
+        allocated = tracemalloc.get_traced_memory()[0] if self.allocations else 0
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            record[0] += time.perf_counter() - wall
+            record[1] += time.thread_time() - cpu
+            if self.allocations:
+                record[2] += tracemalloc.get_traced_memory()[0] - allocated
+            record[3] += 1
+            self.open.remove(opened)
+    
+    def wrap(self, owner, attribute, name):
+        # Time every call of owner.attribute as the named phase
+        original = getattr(owner, attribute)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return original(*args, **kwargs)
+        setattr(owner, attribute, timed)
+    
+    def report(self, **info):
+        if self.allocations:
+            tracemalloc.stop()
+        return {
+            **info,
+            'allocations_traced': self.allocations,
+            'phases': [{'phase': name, 'wall_ms': round(wall * 1000, 3), 'cpu_ms': round(cpu * 1000, 3),
+                        'alloc_kib': round(allocated / 1024, 1), 'calls': calls, 'concurrent': concurrent}
+                       for name, (wall, cpu, allocated, calls, concurrent) in self.phases.items()],
+        }
+
+def profile(variant_name, allocations=True):
+    # Start one game from a fresh interpreter state and time every phase up to
+    # its first presented frame and the end of its background warmup
+    profiler = StartupProfiler(allocations)
+    with profiler.phase("startup total"):
+        with profiler.phase("import numpy"):
+            import numpy
+        with profiler.phase("import pygame"):
+            import pygame
+        with profiler.phase("import game modules"):
+            engine = importlib.import_module("frogger_engine")
+        
+        import frogger_mixer
+        import frogger_sim
+        import frogger_warmup
+        profiler.wrap(engine, 'init_pygame', "pygame init")
+        profiler.wrap(pygame.display, 'set_mode', "display set_mode")
+        profiler.wrap(engine.SoundManager, 'load_sound', "load sounds (background)")
+        profiler.wrap(frogger_warmup.Warmup, 'run', "warmup (background)")
+        profiler.wrap(frogger_mixer.AmbientStream, 'run', "ambient track (background)")
+        profiler.wrap(frogger_sim.Simulation, 'create_cars', "create cars")
+        profiler.wrap(pygame.font, 'Font', "load fonts")
+        profiler.wrap(engine.Game, 'create_trees', "create trees")
+        profiler.wrap(engine.Game, 'refresh_background', "render background")
+        profiler.wrap(pygame.display, 'flip', "display flip")
+        
+        with profiler.phase("Game.__init__"):
+            game = engine.Game(variant=engine.VARIANTS[variant_name])
+        with profiler.phase("first frame"):
+            game.draw()
+        with profiler.phase("wait for warmup"):
+            game.warmup.join()
+        game.sound_manager.stop()
+    pygame.quit()
+    
+    return profiler.report(variant=variant_name, python=platform.python_version(),
+                           pygame=pygame.version.ver, numpy=numpy.__version__,
+                           created=time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+# Marks allocations that include other threads' work
+CONCURRENT_NOTE = "* ran alongside a background phase; allocations include its work"
+
+def concurrent_mark(*phases):
+    return "*" if any(phase.get('concurrent') for phase in phases) else " "
+
+def print_report(report):
+    print(f"{report['variant']} startup (python {report['python']}, pygame {report['pygame']})")
+    print(f"{'phase':<26}{'wall ms':>10}{'cpu ms':>10}{'alloc KiB':>11}{'calls':>7}")
+    for phase in report['phases']:
+        print(f"{phase['phase']:<26}{phase['wall_ms']:>10.1f}{phase['cpu_ms']:>10.1f}"
+              f"{phase['alloc_kib']:>10.1f}{concurrent_mark(phase) if report['allocations_traced'] else ' '}"
+              f"{phase['calls']:>7}")
+    if report['allocations_traced']:
+        print(CONCURRENT_NOTE)
+
+def compare(old, new, threshold):
+    # Per-phase change from old to new; a phase whose wall time grew by more
+    # than threshold percent (and at least a millisecond) is a regression
+    for key in ('variant', 'allocations_traced'):
+        if old[key] != new[key]:
+            print(f"warning: reports differ in {key} ({old[key]} vs {new[key]}), times are not comparable")
+    traced = old['allocations_traced'] and new['allocations_traced']
+    
+    old_phases = {phase['phase']: phase for phase in old['phases']}
+    regressions = []
+    print(f"{'phase':<26}{'old ms':>10}{'new ms':>10}{'change':>9}{'alloc KiB':>12}")
+    for phase in new['phases']:
+        name = phase['phase']
+        before = old_phases.pop(name, None)
+        if before is None:
+            print(f"{name:<26}{'-':>10}{phase['wall_ms']:>10.1f}{'new':>9}")
+            continue
+        change = phase['wall_ms'] - before['wall_ms']
+        percent = 100 * change / before['wall_ms'] if before['wall_ms'] else 0.0
+        alloc_change = f"{phase['alloc_kib'] - before['alloc_kib']:+.1f}" if traced else "-"
+        alloc_change += concurrent_mark(before, phase) if traced else " "
+        regressed = percent > threshold and change >= 1.0
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<26}{before['wall_ms']:>10.1f}{phase['wall_ms']:>10.1f}{percent:>+8.0f}%"
+              f"{alloc_change:>13}{'  REGRESSION' if regressed else ''}")
+    for name, phase in old_phases.items():
+        print(f"{name:<26}{phase['wall_ms']:>10.1f}{'-':>10}{'gone':>9}")
+    if traced:
+        print(CONCURRENT_NOTE)
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile game startup phase by phase, or compare two profiles")
+    parser.add_argument("--variant", choices=("basic", "enhanced", "powerups"), default="enhanced")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--no-allocations", action="store_true",
+                        help="skip allocation tracing, which slows every phase down")
+    parser.add_argument("--cold-cache", action="store_true",
+                        help="use an empty sound cache, as on a first launch")
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video and audio drivers")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="diff two JSON reports instead of profiling")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent wall time growth reported as a regression (default: 10)")
+    args = parser.parse_args()
+    
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path) as report_file:
+                reports.append(json.load(report_file))
+        regressions = compare(*reports, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} phase(s) regressed: {', '.join(regressions)}")
+            sys.exit(1)
+        sys.exit(0)
+    
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    if args.cold_cache:
+        # Must be set before frogger_audio is imported, which reads it
+        os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="frogger-profile-")
+    
+    report = profile(args.variant, allocations=not args.no_allocations)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as report_file:
+            json.dump(report, report_file, indent=2)
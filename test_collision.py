@@ -0,0 +1,97 @@
+import random
+
+from frogger_sim import CAR_SIZES, LANE_HEIGHT, SCREEN_WIDTH, Simulation, overlaps
+
+# Regression checks for collision detection, run headlessly with
+# python -m pytest
+
+def empty_road(continuous_collision):
+    # A simulation with no cars, for tests to place their own
+    sim = Simulation(list(range(6)), continuous_collision=continuous_collision)
+    sim.traffic.clear()
+    return sim
+
+def place_frog(sim, x, y):
+    sim.frog.x, sim.frog.y = x, y
+    sim.frog_previous = (x, y)
+
+def boosted_hop_over_lane(continuous_collision):
+    # A speed-boosted hop moves a whole lane, from below a parked car to above it
+    sim = empty_road(continuous_collision)
+    lane_y = 3 * LANE_HEIGHT
+    sim.traffic.add_car(370, lane_y, 0, *CAR_SIZES[0], color=0)
+    place_frog(sim, 400, lane_y + LANE_HEIGHT // 2)
+    sim.frog.speed_boost = True
+    sim.move(0)
+    sim.step()
+    return sim.lives
+
+def fast_car_through_frog(continuous_collision):
+    # A 200 px/tick car jumps from left of the frog to right of it in one tick
+    sim = empty_road(continuous_collision)
+    lane_y = 3 * LANE_HEIGHT
+    sim.traffic.add_car(300, lane_y, 200, *CAR_SIZES[0], color=0)
+    place_frog(sim, 400, lane_y)
+    sim.step()
+    return sim.lives
+
+def test_boosted_hop_is_caught_only_by_sweeping():
+    assert boosted_hop_over_lane(continuous_collision=False) == 3
+    assert boosted_hop_over_lane(continuous_collision=True) == 2
+
+def test_fast_car_is_caught_only_by_sweeping():
+    assert fast_car_through_frog(continuous_collision=False) == 3
+    assert fast_car_through_frog(continuous_collision=True) == 2
+
+def test_sweep_reports_earliest_impact():
+    sim = empty_road(continuous_collision=True)
+    traffic = sim.traffic
+    traffic.add_car(0, 3 * LANE_HEIGHT, 0, *CAR_SIZES[0], color=0)
+    traffic.add_car(0, 4 * LANE_HEIGHT, 0, *CAR_SIZES[0], color=0)
+    traffic.update()
+    
+    # Hopping up from below both lanes meets the lower car first
+    impact = traffic.sweep(10, 4 * LANE_HEIGHT + 40, 10, 3 * LANE_HEIGHT - 60, 30, 30)
+    assert impact is not None
+    time, car = impact
+    assert 0 < time < 0.5
+    assert traffic.y[car] == 4 * LANE_HEIGHT
+    
+    # Missing both cars sideways
+    assert traffic.sweep(100, 4 * LANE_HEIGHT + 40, 100, 3 * LANE_HEIGHT - 60, 30, 30) is None
+
+def test_colliding_matches_brute_force():
+    random.seed(1)
+    sim = Simulation(list(range(6)), car_types=True)
+    traffic = sim.traffic
+    rng = random.Random(2)
+    for tick in range(600):
+        sim.step()
+        if tick % 5:
+            continue
+        
+        # Every car's rect, truncated like pygame.Rect
+        n = traffic.count
+        cars = [(int(traffic.x[i]), traffic.y[i] - traffic.height[i] // 2, traffic.width[i], traffic.height[i])
+                for i in range(n)]
+        for _ in range(20):
+            rect = (rng.randint(-100, SCREEN_WIDTH + 100), rng.randint(0, 600),
+                    rng.randint(1, 120), rng.randint(1, 120))
+            expected = {i for i in range(n) if overlaps(rect, cars[i])}
+            found = set(traffic.colliding(*rect).tolist())
+            assert found == expected, (tick, rect)
+
+def test_lane_index_finds_every_powerup_in_reach():
+    rng = random.Random(4)
+    sim = Simulation(list(range(6)), powerups=True)
+    for _ in range(200):
+        powerup = sim.powerup_class(rng.randint(0, SCREEN_WIDTH), rng.randint(0, 600), 0, 0)
+        sim.powerups.append(powerup)
+        sim.powerup_index.add(powerup)
+    
+    for _ in range(200):
+        rect = (rng.randint(-50, SCREEN_WIDTH), rng.randint(-50, 600), 30, 30)
+        expected = {id(p) for p in sim.powerups if overlaps(rect, p.get_rect())}
+        found = {id(p) for p in sim.powerup_index.query(*rect, reach=sim.powerup_class.size)
+                 if overlaps(rect, p.get_rect())}
+        assert found == expected, rect
@@ -0,0 +1,34 @@
+import random
+
+import numpy as np
+
+from frogger_sim import CAR_SIZES, LANE_HEIGHT, SCREEN_WIDTH, Simulation
+from frogger_traffic import Traffic
+
+# Regression checks for the slow cars power-up, run headlessly with
+# python -m pytest
+
+def test_slowed_lane_moves_at_its_factor():
+    traffic = Traffic(SCREEN_WIDTH)
+    traffic.add_car(100, 2 * LANE_HEIGHT, 4, *CAR_SIZES[0], color=0)
+    traffic.add_car(100, 3 * LANE_HEIGHT, 4, *CAR_SIZES[0], color=0)
+    traffic.set_slow_factor(0.5, lane_y=2 * LANE_HEIGHT)
+    traffic.update()
+    assert np.allclose(traffic.x[:2], [102, 104])
+
+def test_slow_effect_expires_on_its_timer():
+    random.seed(3)
+    sim = Simulation(list(range(6)), powerups=True)
+    powerup = sim.powerup_class(100, 100, 3, sim.now())
+    sim.powerups.append(powerup)
+    sim.powerup_index.add(powerup)
+    sim.collect_powerup(powerup)
+    assert sim.traffic.world_factor == 0.3
+    
+    # Slow cars lasts 8 seconds of game time
+    for _ in range(8 * 60 - 1):
+        sim.step()
+    assert sim.traffic.world_factor == 0.3
+    for _ in range(3):
+        sim.step()
+    assert sim.traffic.world_factor == 1.0
@@ -0,0 +1,28 @@
+from frogger_sim import Timers
+
+# Regression checks for the timer heap, run headlessly with python -m pytest
+
+def test_timers_fire_in_due_order():
+    timers = Timers()
+    fired = []
+    timers.schedule(3, fired.append, 'c')
+    timers.schedule(1, fired.append, 'a')
+    timers.schedule(2, fired.append, 'b1')
+    timers.schedule(2, fired.append, 'b2')
+    
+    timers.run(1)  # Due times are exclusive
+    assert fired == []
+    timers.run(2.5)
+    assert fired == ['a', 'b1', 'b2']
+    timers.run(10)
+    assert fired == ['a', 'b1', 'b2', 'c']
+
+def test_cancelled_timer_never_fires():
+    timers = Timers()
+    fired = []
+    timer = timers.schedule(1, fired.append, 'cancelled')
+    timers.schedule(2, fired.append, 'kept')
+    timers.cancel(timer)
+    timers.run(10)
+    assert fired == ['kept']
+    assert timers.heap == []